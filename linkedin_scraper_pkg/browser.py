@@ -1,9 +1,105 @@
-from playwright.async_api import Browser, BrowserContext
+import asyncio
+from typing import Awaitable, Callable
+
+from playwright.async_api import Browser, BrowserContext, Page
 from playwright.async_api import async_playwright
-from .config import random_user_agent, SLOW_MO_MS
+from .config import random_user_agent, MAX_OPEN_PAGES, SLOW_MO_MS
 
 # Keep a module-level reference to prevent garbage collection
 _playwright_instance = None
+# Event loop the shared handles below belong to; a new loop (e.g. a second
+# asyncio.run) starts from a clean slate instead of reusing dead handles
+_pool_loop = None
+_pool_lock = None
+_pooled_context = None
+_pooled_context_key = None
+# Set once the scrape that launched the pooled context has warmed up its
+# LinkedIn session, so scrapes reusing the context do not race ahead of it
+_pooled_warm = None
+_cdp_browsers = {}
+_page_slots = None
+
+
+def _reset_pool_if_new_loop() -> None:
+    global _pool_loop, _pool_lock, _playwright_instance, _pooled_context, _pooled_context_key, _page_slots, _pooled_warm
+    loop = asyncio.get_running_loop()
+    if loop is not _pool_loop:
+        _pool_loop = loop
+        _pool_lock = asyncio.Lock()
+        _page_slots = asyncio.BoundedSemaphore(max(1, MAX_OPEN_PAGES))
+        _playwright_instance = None
+        _pooled_context = None
+        _pooled_context_key = None
+        _pooled_warm = None
+        _cdp_browsers.clear()
+
+
+def run_event_loop(coro):
+    """Run `coro` to completion on a fresh event loop, uvloop's when available.
+
+    uvloop is noticeably cheaper per await on the Playwright IPC path; it is
+    optional and unavailable on Windows. The loop is created explicitly
+    rather than via `uvloop.install()`, whose global policy swap is
+    deprecated on newer Pythons.
+    """
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            # Like asyncio.run: cancel leftovers (e.g. Playwright listeners)
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+async def _get_playwright():
+    """Start the Playwright driver once per event loop and reuse it."""
+    global _playwright_instance
+    _reset_pool_if_new_loop()
+    if _playwright_instance is None:
+        _playwright_instance = await async_playwright().start()
+    return _playwright_instance
+
+
+def disable_api_stack_capture() -> bool:
+    """Stop Playwright from walking the Python call stack on every API call.
+
+    Playwright records the caller's frames (via `inspect.stack()`) to attach
+    API names and source locations to traces and errors. Under scraping load
+    that walk is a large share of CPU, so we swap the `inspect` reference in
+    its connection module for a shim that reports no frames. Errors lose the
+    `Page.goto:`-style prefix as a result, so keep this off when debugging.
+    Returns False when Playwright's internals do not look as expected.
+    """
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return False
+    real_inspect = getattr(_connection, "inspect", None)
+    if real_inspect is None or not hasattr(real_inspect, "stack"):
+        return False
+
+    class _NoStackInspect:
+        def __getattr__(self, name):
+            return getattr(real_inspect, name)
+
+        @staticmethod
+        def stack(*args, **kwargs):
+            return []
+
+    _connection.inspect = _NoStackInspect()
+    return True
 
 
 async def launch_browser(headless: bool = True, proxy: str | None = None) -> Browser:
@@ -12,9 +108,8 @@ async def launch_browser(headless: bool = True, proxy: str | None = None) -> Bro
     Headless and proxy are configurable per request. We avoid GPU and
     extension features and disable automation signals where possible.
     """
-    global _playwright_instance
-    _playwright_instance = await async_playwright().start()
-    browser = await _playwright_instance.chromium.launch(
+    pw = await _get_playwright()
+    browser = await pw.chromium.launch(
       headless=headless,
       proxy={"server": proxy} if proxy else None,
       slow_mo=SLOW_MO_MS if SLOW_MO_MS > 0 else None,
@@ -50,9 +145,8 @@ async def launch_persistent_context(
     Returns a BrowserContext (not a Browser) since persistent contexts
     combine both.
     """
-    global _playwright_instance
-    _playwright_instance = await async_playwright().start()
-    context = await _playwright_instance.chromium.launch_persistent_context(
+    pw = await _get_playwright()
+    context = await pw.chromium.launch_persistent_context(
         user_data_dir,
         headless=headless,
         proxy={"server": proxy} if proxy else None,
@@ -170,7 +264,7 @@ async def connect_over_cdp(cdp_url: str) -> Browser:
     """
     import httpx
     
-    p = await async_playwright().start()
+    p = await _get_playwright()
     
     # Try to get WebSocket URL first if using hostname (not localhost/IP)
     if 'host.docker.internal' in cdp_url or any(host in cdp_url for host in ['hostname', 'docker']):
@@ -194,3 +288,144 @@ async def connect_over_cdp(cdp_url: str) -> Browser:
     # Fallback: try direct connect
     browser = await p.chromium.connect_over_cdp(cdp_url)
     return browser
+
+
+async def get_persistent_context(
+    user_data_dir: str,
+    headless: bool = True,
+    proxy: str | None = None,
+    setup: Callable[[BrowserContext], Awaitable[None]] | None = None,
+) -> tuple[BrowserContext, bool]:
+    """Return the shared persistent context, launching it on first use.
+
+    Launching Chromium costs several seconds, so the persistent context is
+    kept open across scrape calls and callers close only their own pages.
+    `setup` (stealth scripts, cookie import) runs once, right after launch
+    and while the pool lock is held, so concurrent callers never get the
+    context before it is ready. The flag is True for the caller that
+    launched it; that caller must call `mark_session_warm()` once its
+    session warm-up is over. Different launch options replace the shared
+    context.
+    """
+    global _pooled_context, _pooled_context_key, _pooled_warm
+    await _get_playwright()
+    key = (user_data_dir, headless, proxy)
+    async with _pool_lock:
+        if _pooled_context is not None and _pooled_context_key == key:
+            return _pooled_context, False
+        if _pooled_context is not None:
+            try:
+                await _pooled_context.close()
+            except Exception:
+                pass
+        context = await launch_persistent_context(user_data_dir, headless=headless, proxy=proxy)
+        if setup is not None:
+            try:
+                await setup(context)
+            except Exception:
+                await context.close()
+                raise
+        context.on("close", _forget_pooled_context)
+        _pooled_context, _pooled_context_key = context, key
+        _pooled_warm = asyncio.Event()
+        return context, True
+
+
+def _forget_pooled_context(context: BrowserContext) -> None:
+    global _pooled_context, _pooled_context_key
+    if context is _pooled_context:
+        _pooled_context = None
+        _pooled_context_key = None
+        mark_session_warm()
+
+
+def mark_session_warm() -> None:
+    """Release scrapes waiting in `wait_session_warm` (safe to call twice)."""
+    if _pooled_warm is not None:
+        _pooled_warm.set()
+
+
+async def wait_session_warm(timeout: float) -> None:
+    """Wait, up to `timeout` seconds, for the pooled context's session warm-up."""
+    warm = _pooled_warm
+    if warm is None or warm.is_set():
+        return
+    try:
+        await asyncio.wait_for(warm.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def get_cdp_browser(cdp_url: str) -> Browser:
+    """Return a shared CDP connection, reconnecting if it was dropped."""
+    await _get_playwright()
+    async with _pool_lock:
+        browser = _cdp_browsers.get(cdp_url)
+        if browser is None or not browser.is_connected():
+            browser = await connect_over_cdp(cdp_url)
+            _cdp_browsers[cdp_url] = browser
+        return browser
+
+
+async def get_cdp_context(cdp_url: str) -> BrowserContext:
+    """Return the context scrapes should open tabs in on a CDP browser.
+
+    Uses Chrome's default context (the user's logged-in profile) when there
+    is one. Otherwise a single context is created under the pool lock and
+    shared by every scrape on that connection, so concurrent calls do not
+    each spin up and tear down their own.
+    """
+    browser = await get_cdp_browser(cdp_url)
+    async with _pool_lock:
+        if browser.contexts:
+            return browser.contexts[0]
+        return await browser.new_context()
+
+
+async def open_page(context: BrowserContext, wait: bool = True) -> Page | None:
+    """Open a tab counted against MAX_OPEN_PAGES; its slot frees on close.
+
+    Each scrape's main tab waits for a slot. Optional extra tabs pass
+    `wait=False` and get None when the cap is reached, so a scrape holding
+    one tab never blocks waiting for a second and callers fall back to
+    sequential work on the tab they have.
+    """
+    _reset_pool_if_new_loop()
+    slots = _page_slots
+    if not wait and slots.locked():
+        return None
+    await slots.acquire()
+    try:
+        page = await context.new_page()
+    except Exception:
+        slots.release()
+        raise
+    page.once("close", lambda _: slots.release())
+    return page
+
+
+async def close_browser() -> None:
+    """Close pooled handles and stop the Playwright driver.
+
+    CDP browsers are only disconnected; the user's Chrome keeps running.
+    """
+    global _playwright_instance
+    if _pool_loop is not asyncio.get_running_loop():
+        return
+    if _pooled_context is not None:
+        try:
+            await _pooled_context.close()
+        except Exception:
+            pass
+    for browser in list(_cdp_browsers.values()):
+        try:
+            await browser.close()
+        except Exception:
+            pass
+    _cdp_browsers.clear()
+    if _playwright_instance is not None:
+        try:
+            await _playwright_instance.stop()
+        except Exception:
+            pass
+        _playwright_instance = None
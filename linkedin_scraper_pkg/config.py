@@ -7,6 +7,26 @@ SLOW_MO_MS = int(os.environ.get("SCRAPER_SLOW_MO_MS", "0"))
 BLOCK_IMAGES = os.environ.get("SCRAPER_BLOCK_IMAGES", "true").lower() != "false"
 USE_CDP = os.environ.get("SCRAPER_USE_CDP", "false").lower() in ["1", "true", "yes"]
 CDP_URL = os.environ.get("SCRAPER_CDP_URL", "http://127.0.0.1:9222")
+DEBUG = os.environ.get("SCRAPER_DEBUG", "false").lower() in ["1", "true", "yes"]
+MAX_PARALLEL_SCRAPES = int(os.environ.get("SCRAPER_MAX_PARALLEL", "3"))
+# Tabs scrapes may hold open at once, across all scrapes in the process
+MAX_OPEN_PAGES = int(os.environ.get("SCRAPER_MAX_PAGES", "8"))
+# Profile scrapes the web UI may start per minute (0 disables the limit)
+MAX_SCRAPES_PER_MINUTE = int(os.environ.get("SCRAPER_MAX_RATE", "6"))
+# How long the web UI reuses a profile's scraped certificates (0 disables)
+RESULT_CACHE_TTL_S = int(os.environ.get("SCRAPER_CACHE_TTL", "3600"))
+RESULT_CACHE_SIZE = 2000
+
+# Requests aborted when BLOCK_IMAGES is on: heavy resource types plus
+# LinkedIn's media CDN and tracking beacons (matched as URL substrings).
+# Stylesheets stay allowed by default because visibility checks and "Show
+# more" clicks depend on layout; add "stylesheet" to the list to drop them.
+BLOCKED_RESOURCE_TYPES = frozenset(
+    t.strip()
+    for t in os.environ.get("SCRAPER_BLOCKED_TYPES", "image,font,media").split(",")
+    if t.strip()
+)
+BLOCKED_URL_PARTS = ("media.licdn.com/dms/image", "/li/track", "/px.gif", "px.ads.linkedin.com")
 
 
 def user_agents():
@@ -5,6 +5,11 @@ from typing import List, Tuple
 from playwright.async_api import BrowserContext, Page
 from .config import COOKIES_FILE
 
+# URL of a page LinkedIn only serves to a signed-in member
+LOGGED_IN_URL_RE = re.compile(r"linkedin\.com/(feed|mynetwork|in/|messaging)")
+# URL of an auth gate the scraper was bounced to
+AUTH_PAGE_URL_RE = re.compile(r"authwall|/login|/signup")
+
 
 async def load_cookies(path: str = COOKIES_FILE) -> List[dict]:
     """Load and sanitize cookies JSON for LinkedIn domains only.
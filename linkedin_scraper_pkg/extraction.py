@@ -4,6 +4,71 @@ from playwright.async_api import Page, Locator
 from .models import CertificateItem
 
 
+# Lines that are UI chrome rather than certificate data - AGGRESSIVE to
+# avoid false positives
+_GARBAGE_LINE_RE = re.compile(
+    "|".join([
+        r"^(Show credential|See credential|Show all|Like|Share|View|Comment)$",
+        r"^(Home|My Network|Jobs|Messaging|Notifications)$",
+        r"^skills?:",  # Skills section header
+        r"licenses.*certifications",  # Section header
+        r"\.pdf$|\.png$|\.jpg$",  # Image/file extensions
+        r"^(Message|Comment|Like|Share|Follow|Unfollow)$",  # Social actions
+        r"^(For Business|Log in|Sign up|Help)$",  # Nav items
+        r"^\d+\s+(new\s+)?notifications?$",  # Notification items
+        r"^new\s+feed\s+updates",  # Feed items
+    ]),
+    re.I,
+)
+
+# Field patterns for the per-line parsers, compiled once
+_ISSUED_LINE_RE = re.compile(r"^Issued\s+(.+)", re.I)
+_ISSUED_RE = re.compile(r"Issued\s*:?\s*(.+)", re.I)
+_EXPIRES_RE = re.compile(r"Expire[sd]?\s+(.+)", re.I)
+_EXPIRES_LINE_RE = re.compile(r"^Expire[sd]?\s+(.+)", re.I)
+_EXPIRES_COLON_RE = re.compile(r"Expire[sd]?\s*:?\s*(.+)", re.I)
+_EXPIRY_WORD_RE = re.compile(r"Expire|kedaluwarsa", re.I)
+_CRED_LINE_RE = re.compile(r"^Credential ID\s*:?\s*(.+)", re.I)
+_CRED_ID_RE = re.compile(r"Credential ID\s*:?\s*([A-Za-z0-9\-\./:]+)", re.I)
+_DATE_CAPTION_RE = re.compile(r"issued|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec", re.I)
+_EXPIRY_CAPTION_RE = re.compile(r"expire|kedaluwarsa|berlaku sampai", re.I)
+# "Name is Title at Company" - person/comment interactions, not certificates
+_IS_RE = re.compile(r"\s+is\s+", re.I)
+_AT_RE = re.compile(r"\s+at\s+", re.I)
+
+# Per-item snapshot for extract_items. "visible" mirrors Playwright's
+# is_visible() (non-empty box, not visibility:hidden); hrefs are the raw
+# attribute values, as get_attribute() would return them.
+_SNAPSHOT_ONE_JS = """el => {
+    const r = el.getBoundingClientRect();
+    const visible = r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    const texts = sel => Array.from(el.querySelectorAll(sel), n => n.innerText || '');
+    const company = el.querySelector("a[href*='/company/']");
+    return {
+        visible,
+        height: r.height,
+        text: el.innerText || '',
+        aria: texts("span[aria-hidden='true']"),
+        company: company ? (company.innerText || '') : null,
+        captions: texts(".pvs-entity__caption-wrapper span[aria-hidden='true']"),
+        links: Array.from(el.querySelectorAll('a[href]'), a => [a.innerText || '', a.getAttribute('href')]),
+    };
+}"""
+_ITEM_SNAPSHOT_JS = f"els => els.map({_SNAPSHOT_ONE_JS})"
+# For extract_items_tiered: snapshots of the elements matching the preferred
+# selector `sel` when there are any (flag true), else of every element
+_TIERED_SNAPSHOT_JS = f"""(els, sel) => {{
+    const primary = els.filter(el => el.matches(sel));
+    return [primary.length > 0, (primary.length ? primary : els).map({_SNAPSHOT_ONE_JS})];
+}}"""
+
+# Text of each lockup's parent block plus the lockup's own href
+_LOCKUP_SNAPSHOT_JS = """els => els.map(el => ({
+    text: el.parentElement ? (el.parentElement.innerText || '') : '',
+    href: el.getAttribute('href'),
+}))"""
+
+
 def _is_help_or_prefs_link(url: str) -> bool:
     if not url:
         return False
@@ -35,38 +100,29 @@ async def extract_new_layout_items(page: Page, source: str) -> List[CertificateI
     results: List[CertificateItem] = []
     
     lockups = page.locator('[data-view-name="license-certifications-lockup-view"]')
-    count = await lockups.count()
+    try:
+        # One round-trip for every lockup's parent text + href
+        blocks = await lockups.evaluate_all(_LOCKUP_SNAPSHOT_JS)
+    except Exception:
+        blocks = []
+    count = len(blocks)
     print(f"[extraction.py] Found {count} certification lockup views (source: {source})")
     
     if count == 0:
         return results
     
-    for i in range(count):
+    for i, block in enumerate(blocks):
         try:
-            lockup = lockups.nth(i)
-            
-            # Get the lockup's immediate parent — this is the cert block
-            parent = lockup.locator("xpath=..")
-            if await parent.count() == 0:
-                continue
-            
-            text_content = ""
-            try:
-                text_content = await parent.inner_text()
-            except Exception:
-                continue
-            
+            # The lockup's immediate parent holds the cert text
+            text_content = block.get("text") or ""
             if not text_content or len(text_content.strip()) < 5:
                 continue
             
             # Get company link from lockup href
             company_link = ""
-            try:
-                href = await lockup.get_attribute("href")
-                if href:
-                    company_link = href if href.startswith("http") else f"https://www.linkedin.com{href}"
-            except Exception:
-                pass
+            href = block.get("href")
+            if href:
+                company_link = href if href.startswith("http") else f"https://www.linkedin.com{href}"
             
             result = _parse_cert_text(text_content, company_link, source + "_newLayout")
             if result:
@@ -115,7 +171,7 @@ def _parse_cert_text(text: str, company_link: str, source: str) -> "CertificateI
         line = clean_lines[j]
         
         # Check for "Issued XXX" pattern
-        m_issued = re.search(r"^Issued\s+(.+)", line, re.I)
+        m_issued = _ISSUED_LINE_RE.search(line)
         if m_issued:
             issue_date = m_issued.group(1).strip()
             # Check for "Issued Aug 2023 · Expires Dec 2025" pattern
@@ -124,7 +180,7 @@ def _parse_cert_text(text: str, company_link: str, source: str) -> "CertificateI
                 issue_date = parts[0].strip()
                 if len(parts) > 1:
                     exp_part = parts[1].strip()
-                    m_exp = re.search(r"Expire[sd]?\s+(.+)", exp_part, re.I)
+                    m_exp = _EXPIRES_RE.search(exp_part)
                     if m_exp:
                         expiry_date = m_exp.group(1).strip()
                     elif "no expiration" in exp_part.lower():
@@ -132,7 +188,7 @@ def _parse_cert_text(text: str, company_link: str, source: str) -> "CertificateI
             continue
         
         # Check for "Expires XXX" pattern
-        m_exp = re.search(r"^Expire[sd]?\s+(.+)", line, re.I)
+        m_exp = _EXPIRES_LINE_RE.search(line)
         if m_exp:
             expiry_date = m_exp.group(1).strip()
             continue
@@ -142,7 +198,7 @@ def _parse_cert_text(text: str, company_link: str, source: str) -> "CertificateI
             continue
         
         # Check for "Credential ID XXX" pattern
-        m_cred = re.search(r"^Credential ID\s*:?\s*(.+)", line, re.I)
+        m_cred = _CRED_LINE_RE.search(line)
         if m_cred:
             cred_id = m_cred.group(1).strip()
             continue
@@ -163,7 +219,8 @@ def _parse_cert_text(text: str, company_link: str, source: str) -> "CertificateI
     if company_link and not _is_help_or_prefs_link(company_link):
         verify_link = company_link
     
-    return CertificateItem(
+    # Every field is a str built above; skip re-validating it
+    return CertificateItem.model_construct(
         certificate_name=cert_name,
         credential_id=cred_id,
         issuer=issuer,
@@ -189,12 +246,8 @@ async def extract_items(
     - Date: found in caption-wrapper
     - Skills: usually in separate section
     """
-    results: List[CertificateItem] = []
     base = root or page
 
-    # Find certificate item containers
-    items = None
-    
     # If scope_selector already contains comma-separated selectors, use it directly
     if "," in scope_selector:
         # Direct usage for multi-selectors like "li, div[data-view-name='profile-component-entity']"
@@ -207,69 +260,86 @@ async def extract_items(
             "li",                                  # Generic li
         ]
     
+    # Snapshot the first selector that matches anything; the snapshot itself
+    # tells us whether it matched, so no separate count() resolution
+    snapshots = []
     for item_sel in item_selectors:
         try:
-            candidate_items = base.locator(item_sel)
-            count = await candidate_items.count()
-            if count > 0:
-                items = candidate_items
-                break
+            snapshots = await base.locator(item_sel).evaluate_all(_ITEM_SNAPSHOT_JS)
         except Exception:
             continue
+        if snapshots:
+            break
 
-    if not items:
-        return results
+    if not snapshots:
+        return []
 
-    count = await items.count()
+    count = len(snapshots)
     print(f"[extraction.py] Found {count} items with selector '{scope_selector}' (source: {source})")
-    
-    for i in range(count):
+    return _parse_item_snapshots(snapshots, source, require_visible)
+
+
+async def extract_items_tiered(
+    page: Page,
+    scope_selector: str,
+    fallback_selector: str,
+    source: str,
+    fallback_source: str,
+    require_visible: bool = True,
+    root: Page | Locator | None = None,
+) -> tuple[List[CertificateItem], str]:
+    """Extract with `scope_selector`, falling back to `fallback_selector`.
+
+    Equivalent to calling `extract_items` with the first selector and, when
+    that yields nothing, again with the second. One query over the union
+    picks the tier: the usual cases (first selector matches and parses, or
+    matches nothing) cost a single snapshot; only a first tier that matches
+    but parses to nothing needs a second call. Returns the items and the
+    source label of the tier that produced them.
+    """
+    base = root or page
+    try:
+        is_primary, snapshots = await base.locator(f"{scope_selector}, {fallback_selector}").evaluate_all(
+            _TIERED_SNAPSHOT_JS, scope_selector
+        )
+    except Exception:
+        return [], source
+    if not is_primary:
+        print(f"[extraction.py] Found {len(snapshots)} items with selector '{fallback_selector}' (source: {fallback_source})")
+        return _parse_item_snapshots(snapshots, fallback_source, require_visible), fallback_source
+    print(f"[extraction.py] Found {len(snapshots)} items with selector '{scope_selector}' (source: {source})")
+    results = _parse_item_snapshots(snapshots, source, require_visible)
+    if results:
+        return results, source
+    return await extract_items(page, fallback_selector, fallback_source, require_visible, root), fallback_source
+
+
+def _parse_item_snapshots(snapshots: list[dict], source: str, require_visible: bool) -> List[CertificateItem]:
+    """Turn `_ITEM_SNAPSHOT_JS` snapshots into certificate items."""
+    results: List[CertificateItem] = []
+    for snap in snapshots:
         try:
-            item = items.nth(i)
-            
             # Skip non-visible items
-            try:
-                if require_visible and not await item.is_visible():
-                    continue
-            except Exception:
-                pass
+            if require_visible and not snap["visible"]:
+                continue
 
             # Skip zero-height items
-            try:
-                box = await item.bounding_box()
-                if box and box.get("height", 0) < 8:
-                    continue
-            except Exception:
-                pass
-
-            text = await item.inner_text()
+            if snap["visible"] and snap["height"] < 8:
+                continue
+
+            text = snap["text"]
             if not text or len(text.strip()) < 5:
                 continue
 
             lines = [l.strip() for l in text.split("\n") if l.strip()]
             
             # Filter garbage lines - AGGRESSIVE to avoid false positives
-            garbage_patterns = [
-                r"^(Show credential|See credential|Show all|Like|Share|View|Comment)$",
-                r"^(Home|My Network|Jobs|Messaging|Notifications)$",
-                r"^skills?:",  # Skills section header
-                r"licenses.*certifications",  # Section header
-                r"\.pdf$|\.png$|\.jpg$",  # Image/file extensions
-                r"^(Message|Comment|Like|Share|Follow|Unfollow)$",  # Social actions
-                r"^(For Business|Log in|Sign up|Help)$",  # Nav items
-                r"^\d+\s+(new\s+)?notifications?$",  # Notification items
-                r"^new\s+feed\s+updates",  # Feed items
-            ]
-            
-            clean_lines = [l for l in lines if not any(re.search(p, l, re.I) for p in garbage_patterns) and len(l) > 1]
+            clean_lines = [l for l in lines if not _GARBAGE_LINE_RE.search(l) and len(l) > 1]
             if not clean_lines:
                 continue
 
             # Prefer aria-hidden spans (often hold the real title) and avoid picking logo text
-            try:
-                aria_spans = await item.locator("span[aria-hidden='true']").all_inner_texts()
-            except Exception:
-                aria_spans = []
+            aria_spans = snap["aria"]
 
             candidate_names = []
             if aria_spans and aria_spans[0].strip():
@@ -289,7 +359,7 @@ async def extract_items(
                 continue
             
             # Skip person/comment interactions (e.g., "Name is Title at Company")
-            if re.search(r"\s+is\s+", cert_name, re.I) and re.search(r"\s+at\s+", cert_name, re.I):
+            if _IS_RE.search(cert_name) and _AT_RE.search(cert_name):
                 continue
             
             # Skip if text looks like it's not a certificate
@@ -313,42 +383,33 @@ async def extract_items(
                     issuer = candidate
 
             # If not found via spans, try company link
-            if not issuer:
-                try:
-                    company_link = item.locator("a[href*='/company/']").first
-                    if await company_link.count():
-                        issuer = (await company_link.inner_text()).strip()
-                except Exception:
-                    pass
+            if not issuer and snap["company"] is not None:
+                issuer = snap["company"].strip()
 
             # Extract dates
             issue_date = ""
             expiry_date = ""
             
             # Look for caption with date info
-            try:
-                captions = await item.locator(".pvs-entity__caption-wrapper span[aria-hidden='true']").all_inner_texts()
-                for caption in captions:
-                    caption = caption.strip()
-                    if re.search(r"issued|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec", caption, re.I):
-                        issue_date = caption
-                    if re.search(r"expire|kedaluwarsa|berlaku sampai", caption, re.I):
-                        expiry_date = caption
-            except:
-                pass
+            for caption in snap["captions"]:
+                caption = caption.strip()
+                if _DATE_CAPTION_RE.search(caption):
+                    issue_date = caption
+                if _EXPIRY_CAPTION_RE.search(caption):
+                    expiry_date = caption
 
             # Fallback: extract from text lines if not found
             if not issue_date:
                 for line in lines:
-                    m = re.search(r"Issued\s*:?\s*(.+)", line, re.I)
+                    m = _ISSUED_RE.search(line)
                     if m:
                         issue_date = m.group(1).strip()
                         break
 
             if not expiry_date:
                 for line in lines:
-                    if re.search(r"Expire|kedaluwarsa", line, re.I):
-                        m = re.search(r"Expire[sd]?\s*:?\s*(.+)", line, re.I)
+                    if _EXPIRY_WORD_RE.search(line):
+                        m = _EXPIRES_COLON_RE.search(line)
                         if m:
                             expiry_date = m.group(1).strip()
                         elif "no expiration" in line.lower():
@@ -358,33 +419,26 @@ async def extract_items(
             # Extract credential ID
             cred_id = ""
             for line in lines:
-                m = re.search(r"Credential ID\s*:?\s*([A-Za-z0-9\-\./:]+)", line, re.I)
+                m = _CRED_ID_RE.search(line)
                 if m:
                     cred_id = m.group(1)
                     break
 
             # Extract verify link
             verify_link = ""
-            try:
-                # Look for credential/verify links
-                links = item.locator("a[href]")
-                link_count = await links.count()
-                for j in range(link_count):
-                    link = links.nth(j)
-                    link_text = await link.inner_text()
-                    if "credential" in link_text.lower() or "verify" in link_text.lower():
-                        href = await link.get_attribute("href")
-                        if href:
-                            verify_link = href if href.startswith("http") else f"https://www.linkedin.com{href}"
-                            break
-                
-                # Fallback: get first external link
-                if not verify_link and link_count > 0:
-                    href = await links.first.get_attribute("href")
-                    if href and href.startswith("http"):
-                        verify_link = href
-            except Exception:
-                pass
+            # Look for credential/verify links
+            links = snap["links"]
+            for link_text, href in links:
+                if "credential" in link_text.lower() or "verify" in link_text.lower():
+                    if href:
+                        verify_link = href if href.startswith("http") else f"https://www.linkedin.com{href}"
+                        break
+            
+            # Fallback: get first external link
+            if not verify_link and links:
+                href = links[0][1]
+                if href and href.startswith("http"):
+                    verify_link = href
 
             # Skip LinkedIn help/account/privacy links
             if _is_help_or_prefs_link(verify_link):
@@ -402,8 +456,9 @@ async def extract_items(
             if issuer and issuer.startswith("·") and not issue_date and not cred_id and not expiry_date:
                 continue
 
+            # Every field is a str built above; skip re-validating it
             results.append(
-                CertificateItem(
+                CertificateItem.model_construct(
                     certificate_name=cert_name,
                     credential_id=cred_id,
                     issuer=issuer,
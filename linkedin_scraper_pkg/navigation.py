@@ -2,6 +2,37 @@ import asyncio
 import random
 from typing import Tuple
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Resolves truthy once the certifications section exists ("found") or the
+# page grew past `prev` ("grew"); used to replace fixed post-scroll sleeps.
+_SCROLL_PROGRESS_JS = """(prev) => {
+    if (document.querySelector('#licenses_and_certifications, [data-view-name="license-certifications-lockup-view"]')) {
+        return 'found';
+    }
+    return document.body.scrollHeight > prev ? 'grew' : false;
+}"""
+
+# Start near top to ensure a deterministic scroll path, then step down with
+# the same 0.6-1.1s randomized pauses `random_delay` would use.
+_WARM_UP_SCROLL_JS = """async (steps) => {
+    const pause = () => new Promise(r => setTimeout(r, 600 + Math.random() * 500));
+    window.scrollTo({top: 0, behavior: 'instant'});
+    for (const frac of steps) {
+        window.scrollTo({top: document.body.scrollHeight * frac, behavior: 'smooth'});
+        await pause();
+    }
+}"""
+
+# Certificate entries on a details page: SDUI lockups and legacy list items
+_DETAIL_ITEMS_SELECTOR = '[data-view-name="license-certifications-lockup-view"], main li'
+_MORE_ITEMS_JS = "([sel, n]) => document.querySelectorAll(sel).length > n"
+# Count matches, then scroll the window down a third of the page
+_COUNT_THEN_SCROLL_JS = """(sel) => {
+    const n = document.querySelectorAll(sel).length;
+    window.scrollBy(0, document.body.scrollHeight / 3);
+    return n;
+}"""
 
 
 async def random_delay(min_sec: float = 0.5, max_sec: float = 1.5) -> None:
@@ -13,27 +44,81 @@ async def random_delay(min_sec: float = 0.5, max_sec: float = 1.5) -> None:
     await asyncio.sleep(random.uniform(min_sec, max_sec))
 
 
-async def goto_with_retry(page: Page, url: str, timeout_ms: int, tries: int = 2) -> Tuple[bool, str]:
-    """Navigate to a URL with bounded retries and network idle waits.
+# Base pause per observed page state: near zero on the happy path, backing
+# off only when LinkedIn gave a failure signal
+_ADAPTIVE_WAIT_S = {"ok": 0.2, "miss": 1.0, "authwall": 2.0, "rate_limited": 4.0}
+
+
+async def adaptive_wait(page: Page, state: str = "ok", settle_ms: int = 2000) -> None:
+    """Pause according to what the last step observed instead of a fixed sleep.
 
-    Returns (success, error_message). It uses Playwright's `networkidle`
-    and a small post-load delay to stabilize dynamic content.
+    `state` is one of "ok", "miss" (expected content absent), "authwall" or
+    "rate_limited". After the base pause, an "ok" page is only waited on
+    until the document reports `complete` (at most `settle_ms`), so already
+    settled pages continue immediately.
+    """
+    await asyncio.sleep(_ADAPTIVE_WAIT_S.get(state, 1.0))
+    if state != "ok":
+        return
+    try:
+        await page.wait_for_function("document.readyState === 'complete'", timeout=settle_ms)
+    except Exception:
+        pass
+
+
+async def goto_with_retry(
+    page: Page,
+    url: str,
+    timeout_ms: int,
+    tries: int = 2,
+    wait_until: str = "domcontentloaded",
+) -> Tuple[bool, str]:
+    """Navigate to a URL with bounded retries and a small post-load delay.
+
+    Returns (success, error_message). LinkedIn keeps long-poll and tracking
+    requests open, so `networkidle` mostly ran into the timeout; we wait for
+    `domcontentloaded` by default and, if that times out after the target
+    document has already committed and become interactive, proceed anyway.
     """
     last_err = ""
     for attempt in range(tries):
         try:
-            await page.goto(url, timeout=timeout_ms, wait_until="networkidle")
-            await random_delay(1.0, 2.0)
+            response = await page.goto(url, timeout=timeout_ms, wait_until=wait_until)
+            if response is not None and response.status == 429 and attempt < tries - 1:
+                last_err = "HTTP 429"
+                await adaptive_wait(page, "rate_limited")
+                continue
+            await adaptive_wait(page, "ok")
             return True, ""
+        except PlaywrightTimeoutError as e:
+            last_err = str(e)
+            if await _landed_on(page, url):
+                return True, ""
+            if attempt < tries - 1:
+                await adaptive_wait(page, "miss")
+            else:
+                return False, last_err
         except Exception as e:
             last_err = str(e)
             if attempt < tries - 1:
-                await random_delay(1.0, 2.0)
+                await adaptive_wait(page, "miss")
             else:
                 return False, last_err
     return False, last_err
 
 
+async def _landed_on(page: Page, url: str) -> bool:
+    """True if `page` shows `url` (ignoring query/fragment) past the loading state."""
+    def _strip(u: str) -> str:
+        return u.split("#", 1)[0].split("?", 1)[0].rstrip("/")
+    try:
+        if _strip(page.url) != _strip(url):
+            return False
+        return await page.evaluate("document.readyState") != "loading"
+    except Exception:
+        return False
+
+
 async def navigate_via_js(page: Page, url: str, timeout_ms: int = 20000) -> Tuple[bool, str]:
     """Navigate via window.location.href to bypass SDUI client-side interception.
 
@@ -46,7 +131,12 @@ async def navigate_via_js(page: Page, url: str, timeout_ms: int = 20000) -> Tupl
     try:
         await page.evaluate(f"window.location.href = '{url}'")
         await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
-        await page.wait_for_timeout(3000)
+        # SDUI renders `main` client-side after DOMContentLoaded; continue as
+        # soon as it is there rather than after a fixed 3s
+        try:
+            await page.wait_for_selector("main", state="attached", timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
         await random_delay(0.5, 1.5)
         return True, ""
     except Exception as e:
@@ -88,31 +178,36 @@ async def warm_up_scroll(page: Page) -> None:
     and to let network idle between steps.
     """
     try:
-        # Start near top to ensure deterministic scroll path
-        await page.evaluate("window.scrollTo({top: 0, behavior: 'instant'})")
-        steps = [0.25, 0.5, 0.75, 1.0]
-        for frac in steps:
-            await page.evaluate(
-                "window.scrollTo({top: document.body.scrollHeight * %s, behavior: 'smooth'})" % frac
-            )
-            await random_delay(0.6, 1.1)
+        # Whole sequence runs in-page: one round-trip instead of one per step
+        await page.evaluate(_WARM_UP_SCROLL_JS, [0.25, 0.5, 0.75, 1.0])
     except Exception:
         pass
 
 
-async def deep_scroll(page: Page, steps: int = 6) -> None:
+async def deep_scroll(page: Page, steps: int = 6, step_timeout_ms: int = 1200) -> None:
     """Perform a deeper incremental scroll to force-load lazy content.
 
     Useful when important sections (e.g., certificates) are not yet in the DOM
-    after the warm-up scroll. Keeps pauses between steps to allow network idle.
+    after the warm-up scroll. Each step waits only until the page grows (or
+    `step_timeout_ms` passes) and scrolling stops once the certifications
+    section is in the DOM.
     """
     try:
         for i in range(1, steps + 1):
-            frac = i / steps
-            await page.evaluate(
-                "window.scrollTo({top: document.body.scrollHeight * %s, behavior: 'smooth'})" % frac
+            prev_height = await page.evaluate(
+                "(frac) => { window.scrollTo({top: document.body.scrollHeight * frac, behavior: 'instant'});"
+                " return document.body.scrollHeight; }",
+                i / steps,
             )
-            await random_delay(0.7, 1.2)
+            try:
+                progress = await page.wait_for_function(
+                    _SCROLL_PROGRESS_JS, arg=prev_height, timeout=step_timeout_ms
+                )
+                if await progress.json_value() == "found":
+                    break
+            except Exception:
+                # No growth within the step budget; keep scrolling down
+                continue
     except Exception:
         pass
 
@@ -136,24 +231,50 @@ async def smooth_scroll_to(page: Page, element) -> bool:
     return False
 
 
+async def wait_for_more_items(page: Page, prev_count: int, timeout_ms: int) -> bool:
+    """Wait until more than `prev_count` certificate entries exist.
+
+    Returns as soon as new entries render instead of sleeping a fixed time;
+    False if none appeared within `timeout_ms`.
+    """
+    try:
+        await page.wait_for_function(
+            _MORE_ITEMS_JS, arg=[_DETAIL_ITEMS_SELECTOR, prev_count], timeout=timeout_ms
+        )
+        return True
+    except Exception:
+        return False
+
+
 async def stabilize_detail_view(page: Page, max_wait: int = 25000) -> None:
     """Trigger lazy-loading in details view using incremental scroll.
 
-    We scroll in thirds and finally to the bottom to prompt AJAX loads,
-    while bounding total wait to avoid indefinite scrolling.
+    We scroll in thirds until the item count stops growing for two
+    consecutive checks, then finish at the bottom to prompt a last AJAX load.
+    Bounded to a handful of passes to avoid indefinite scrolling.
     """
     try:
-        lst = page.locator(
-            "main ul.pvs-list li, main li.pvs-list__paged-list-item, main li[role='listitem']"
-        )
+        sel = "main ul.pvs-list li, main li.pvs-list__paged-list-item, main li[role='listitem']"
+        lst = page.locator(sel)
         if await lst.count() == 0:
             try:
                 await lst.first.wait_for(state="visible", timeout=max_wait)
             except Exception:
                 pass
-        for _ in range(3):
-            await page.evaluate("window.scrollBy(0, document.body.scrollHeight/3)")
-            await random_delay(0.6, 1.2)
+        prev = -1
+        stable_count = 0
+        for _ in range(6):
+            # Count and next scroll step in one round-trip; an extra third
+            # scrolled on the final pass is covered by the bottom scroll below
+            cur = await page.evaluate(_COUNT_THEN_SCROLL_JS, sel)
+            if cur == prev:
+                stable_count += 1
+            else:
+                stable_count = 0
+            if stable_count >= 2 and cur > 0:
+                break
+            prev = cur
+            await random_delay(0.4, 0.8)
         await page.evaluate("window.scrollTo({top: document.body.scrollHeight, behavior: 'smooth'})")
         await random_delay(1.0, 1.8)
     except Exception:
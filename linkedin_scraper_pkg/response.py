@@ -16,12 +16,13 @@ def build_response(
       "not found" to match current clients.
     - `found` and `total_certificates` reflect extraction results.
     """
+    certificates_list = [i.model_dump() for i in items] if items else "not found"
     resp = {
         "url": req.url,
         "keyword": req.keyword,
         "found": len(items) > 0,
         "total_certificates": len(items),
-        "certificates_list": [i.dict() for i in items] if items else "not found",
+        "certificates_list": certificates_list,
         "cookies_loaded": cookies_loaded,
         "guest_mode": is_guest,
         "debug": " | ".join(debug_msgs),
@@ -2,6 +2,75 @@ import re
 from typing import Tuple
 from playwright.async_api import Page, Locator
 
+__all__ = ["find_cert_section", "find_show_all_button", "CERT_ANCHOR_SELECTOR", "CERT_ENTRY_SELECTOR"]
+
+# Present as soon as the certifications section has rendered (old ID anchor
+# or a new-layout lockup); cheap to wait on before running the strategies
+CERT_ANCHOR_SELECTOR = '#licenses_and_certifications, [data-view-name="license-certifications-lockup-view"]'
+# A single certificate entry inside a located section
+CERT_ENTRY_SELECTOR = "li, [data-view-name='license-certifications-lockup-view'], div[data-view-name='profile-component-entity']"
+
+# Section heading text (EN + ID). The short "Sertifikat" variant is only
+# trusted for the heading-role/section-text strategies, not bare h2-h4 tags.
+# Word boundaries keep e.g. "Lisensinya" in a job description from matching.
+_SECTION_TEXT_RE = re.compile(
+    r"\b(?:Licenses\s*(?:&|and)\s*certifications|Lisensi\s*&\s*sertifikasi|Sertifikasi|Lisensi|Sertifikat)\b",
+    re.I,
+)
+_HEADER_TAG_TEXT_RE = re.compile(
+    r"\b(?:Licenses\s*(?:&|and)\s*certifications|Lisensi\s*&\s*sertifikasi|Sertifikasi|Lisensi)\b",
+    re.I,
+)
+
+# "Show all" / "Tampilkan semua" naming this section, preferred over the bare
+# phrases, which can also belong to a nested sub-list
+_SHOW_ALL_SECTION_RE = re.compile(
+    r"Show all\s*(certifications|licenses)|Tampilkan semua\s*(sertifikasi|lisensi)", re.I
+)
+_SHOW_ALL_RE = re.compile(r"Show all|Tampilkan semua", re.I)
+_SHOW_TEXT_RE = re.compile(r"show|tampilkan", re.I)
+
+# Index of the first element whose text contains any keyword, scanned in a
+# single round-trip instead of one inner_text() call per element.
+_FIRST_TEXT_MATCH_JS = """(els, keywords) => els.findIndex(el => {
+    const text = (el.innerText || '').toLowerCase();
+    return keywords.some(k => text.includes(k));
+})"""
+
+# Whether an element is visible (as Playwright's is_visible() judges it) and
+# its text contains any keyword
+_LAST_LINK_OK_JS = """(el, keywords) => {
+    const r = el.getBoundingClientRect();
+    if (!(r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden')) return false;
+    const text = (el.innerText || '').toLowerCase();
+    return keywords.some(k => text.includes(k));
+}"""
+
+
+_PIN_ATTR = "data-cert-section"
+
+# Move the pin attribute onto the matched element (clearing any stale one
+# from an earlier call on the same document)
+_PIN_SECTION_JS = """(el, attr) => {
+    document.querySelectorAll('[' + attr + ']').forEach(e => e.removeAttribute(attr));
+    el.setAttribute(attr, '1');
+}"""
+
+
+async def _pin_section(page: Page, section: Locator) -> Locator:
+    """Tag the resolved section and return a locator for the tag.
+
+    Heading-role, text-filter and nth() locators re-run their whole search
+    every time they are used (and nth() can drift as sections lazy-load), so
+    callers get a cheap `[data-cert-section]` locator instead. Falls back to
+    the original locator if tagging fails.
+    """
+    try:
+        await section.evaluate(_PIN_SECTION_JS, _PIN_ATTR)
+        return page.locator(f"[{_PIN_ATTR}]").first
+    except Exception:
+        return section
+
 
 async def find_cert_section(page: Page) -> Tuple[Locator | None, str]:
     """Locate the 'Licenses & Certifications' section using robust strategies.
@@ -11,53 +80,45 @@ async def find_cert_section(page: Page) -> Tuple[Locator | None, str]:
     - Section headers with localized text via :has()
     - Data attributes as fallbacks
     - Full section scan with keyword heuristics
-    Returns (section_locator, strategy_tag).
+    Returns (section_locator, strategy_tag). A found section is pinned to a
+    plain attribute selector so later uses do not redo the search.
     """
-    # Strategy 1: Known ID
+    # Strategy 1: Known ID. Locators are lazy, so the chained locator is
+    # empty whenever the anchor is missing and a single count() suffices.
     try:
-        sec_by_id = page.locator("#licenses_and_certifications")
-        if await sec_by_id.count() > 0:
-            parent_section = sec_by_id.locator("..").locator("section").first
-            if await parent_section.count() > 0:
-                return parent_section, "ID"
+        parent_section = page.locator("#licenses_and_certifications").locator("..").locator("section").first
+        if await parent_section.count() > 0:
+            return await _pin_section(page, parent_section), "ID"
     except Exception:
         pass
 
     # Strategy 2: Localized header via :has() and heading role
     try:
-        text_re = re.compile(
-            r"Licenses\s*&\s*certifications|Licenses\s*and\s*certifications|Lisensi\s*&\s*sertifikasi|Sertifikasi|Lisensi|Sertifikat",
-            re.I,
-        )
+        text_re = _SECTION_TEXT_RE
         # Heading role (visible text)
         heading = page.get_by_role("heading", name=text_re).first
-        if await heading.count() > 0:
-            sec_h = heading.locator("xpath=ancestor::section[1]").first
-            if await sec_h.count() > 0:
-                return sec_h, "HeadingRole"
+        sec_h = heading.locator("xpath=ancestor::section[1]").first
+        if await sec_h.count() > 0:
+            return await _pin_section(page, sec_h), "HeadingRole"
         # Try different selectors for header
         sec = page.locator("section:has(.pvs-header__title)").filter(has_text=text_re).first
         if await sec.count() > 0:
-            return sec, "HeaderHas"
-        # Try generic section filter
-        sec2 = page.locator("section").filter(has_text=text_re).first
+            return await _pin_section(page, sec), "HeaderHas"
+        # Try generic section filter, scoped to profile content
+        sec2 = page.locator("main section").filter(has_text=text_re).first
         if await sec2.count() > 0:
-            return sec2, "SectionText"
+            return await _pin_section(page, sec2), "SectionText"
     except Exception:
         pass
 
     # Strategy 2b: Look for h2, h3 with cert text, then get parent section
     try:
-        text_re = re.compile(
-            r"Licenses\s*&\s*certifications|Licenses\s*and\s*certifications|Lisensi\s*&\s*sertifikasi|Sertifikasi|Lisensi",
-            re.I,
-        )
+        text_re = _HEADER_TAG_TEXT_RE
         for tag in ["h2", "h3", "h4"]:
-            headers = page.locator(f"{tag}").filter(has_text=text_re)
-            if await headers.count() > 0:
-                parent = headers.first.locator("xpath=ancestor::section[1]")
-                if await parent.count() > 0:
-                    return parent, f"HeaderTag:{tag}"
+            headers = page.locator(f"main {tag}").filter(has_text=text_re)
+            parent = headers.first.locator("xpath=ancestor::section[1]")
+            if await parent.count() > 0:
+                return await _pin_section(page, parent), f"HeaderTag:{tag}"
     except Exception:
         pass
 
@@ -71,32 +132,28 @@ async def find_cert_section(page: Page) -> Tuple[Locator | None, str]:
         ]:
             candidate = page.locator(sel).first
             if await candidate.count() > 0:
-                return candidate, f"Attr:{sel}"
+                return await _pin_section(page, candidate), f"Attr:{sel}"
     except Exception:
         pass
 
     # Strategy 4: Full sections scan with better keyword matching
     try:
         all_sections = page.locator("section")
-        count = await all_sections.count()
-        for i in range(count):
-            sec = all_sections.nth(i)
-            text = (await sec.inner_text()).lower()
-            # More flexible matching
-            if any(k in text for k in ["licens", "certif", "sertif", "credential"]):
-                return sec, f"Scan#{i}"
+        # More flexible matching
+        i = await all_sections.evaluate_all(
+            _FIRST_TEXT_MATCH_JS, ["licens", "certif", "sertif", "credential"]
+        )
+        if i >= 0:
+            return await _pin_section(page, all_sections.nth(i)), f"Scan#{i}"
     except Exception:
         pass
 
     # Strategy 5: Look for specific pvs (profile visual service) sections
     try:
         all_divs = page.locator("[class*='pvs-section']")
-        count = await all_divs.count()
-        for i in range(count):
-            div = all_divs.nth(i)
-            text = (await div.inner_text()).lower()
-            if any(k in text for k in ["licens", "certif", "sertif"]):
-                return div, f"PVSSection#{i}"
+        i = await all_divs.evaluate_all(_FIRST_TEXT_MATCH_JS, ["licens", "certif", "sertif"])
+        if i >= 0:
+            return await _pin_section(page, all_divs.nth(i)), f"PVSSection#{i}"
     except Exception:
         pass
 
@@ -107,88 +164,47 @@ async def find_show_all_button(section: Locator) -> Locator | None:
     """Find a visible 'Show all certifications' button or link in the section.
 
     Prefer text-based matching and href hints, returning a locator ready to click.
-    Ensures the element is visible to avoid clicking honeypots.
+    Ensures the element is visible to avoid clicking honeypots: each strategy
+    narrows to its first *visible* match with the `visible=true` engine, and
+    `is_visible()` resolves to False when nothing matches, so every strategy
+    is a single query with no separate `count()`.
     """
-    # Strategy 1: Text-based (EN + ID variants) - exact phrases
-    try:
-        patterns = [
-            re.compile(r"Show all\s*(certifications|licenses)", re.I),
-            re.compile(r"Tampilkan semua\s*(sertifikasi|lisensi)", re.I),
-            re.compile(r"Show all", re.I),
-            re.compile(r"Tampilkan semua", re.I),
-        ]
-        for pattern in patterns:
-            btn = section.get_by_text(pattern).first
-            if await btn.count() > 0:
-                try:
-                    if await btn.is_visible():
-                        return btn
-                except Exception:
-                    pass
-    except Exception:
-        pass
-
-    # Strategy 1b: Button/Link containing show/tampilkan text
-    try:
-        btn = section.locator("a, button").filter(
-            has_text=re.compile(r"show|tampilkan", re.I)
-        ).first
-        if await btn.count() > 0:
-            try:
-                if await btn.is_visible():
-                    return btn
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Strategy 2: Href-based
-    try:
-        btn2 = section.locator("a[href*='/details/certifications/']").first
-        if await btn2.count() > 0:
-            try:
-                if await btn2.is_visible():
-                    return btn2
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Strategy 2b: Details/licenses href
-    try:
-        btn2b = section.locator("a[href*='/details/licenses/']").first
-        if await btn2b.count() > 0:
-            try:
-                if await btn2b.is_visible():
-                    return btn2b
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Strategy 3: Footer link
-    try:
-        btn3 = section.locator("div[class*='footer'] a, div[class*='Footer'] a").first
-        if await btn3.count() > 0:
-            try:
-                if await btn3.is_visible():
-                    return btn3
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Strategy 4: Last anchor in section (often "Show all" is positioned at end)
+    # Strategy 1: Text-based (EN + ID variants): section-specific phrases
+    # first, the bare phrases only when none of those is visible
+    for pattern in (_SHOW_ALL_SECTION_RE, _SHOW_ALL_RE):
+        try:
+            btn = section.get_by_text(pattern).locator("visible=true").first
+            if await btn.is_visible():
+                return btn
+        except Exception:
+            pass
+
+    candidates = [
+        # Strategy 1b: Button/Link containing show/tampilkan text
+        section.locator("a, button").filter(has_text=_SHOW_TEXT_RE),
+        # Strategy 2: Href-based
+        section.locator("a[href*='/details/certifications/']"),
+        # Strategy 2b: Details/licenses href
+        section.locator("a[href*='/details/licenses/']"),
+        # Strategy 3: Footer link
+        section.locator("div[class*='footer'] a, div[class*='Footer'] a"),
+    ]
+    for candidate in candidates:
+        try:
+            btn = candidate.locator("visible=true").first
+            if await btn.is_visible():
+                return btn
+        except Exception:
+            pass
+
+    # Strategy 4: Last anchor in section (often "Show all" is positioned at end);
+    # visibility and text are checked together in one round-trip. The cheap
+    # count() guard keeps an anchor-less section from waiting out the timeout.
     try:
-        last_link = section.locator("a").last
-        if await last_link.count() > 0:
-            text = await last_link.inner_text()
-            if any(k in text.lower() for k in ["show", "tampilkan", "detail"]):
-                try:
-                    if await last_link.is_visible():
-                        return last_link
-                except Exception:
-                    pass
+        links = section.locator("a")
+        last_link = links.last
+        if await links.count() > 0 and await last_link.evaluate(_LAST_LINK_OK_JS, ["show", "tampilkan", "detail"], timeout=1000):
+            return last_link
     except Exception:
         pass
 
@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import os
 import sys
+import atexit
+import signal
 import time
 import shutil
+import socket
 import tempfile
 import subprocess
 import webbrowser
-import urllib.request
-import urllib.error
 from threading import Thread
 
 import uvicorn
 
+# Chrome process spawned by start_cdp; None when CDP was already running
+_cdp_process: subprocess.Popen | None = None
+
 
 def _detect_chrome_path() -> str | None:
     if sys.platform == "darwin":
@@ -37,17 +41,20 @@ def _detect_chrome_path() -> str | None:
     )
 
 
-def _cdp_is_running(port: int) -> bool:
+def _tcp_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
     try:
-        with urllib.request.urlopen(
-            f"http://127.0.0.1:{port}/json/version", timeout=2
-        ) as response:
-            return response.status == 200
-    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError):
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
         return False
 
 
+def _cdp_is_running(port: int) -> bool:
+    return _tcp_port_open("127.0.0.1", port)
+
+
 def start_cdp(port: int = 9222) -> None:
+    global _cdp_process
     if _cdp_is_running(port):
         print(f"✅ Chrome CDP already running on port {port}")
         return
@@ -63,6 +70,8 @@ def start_cdp(port: int = 9222) -> None:
         f"--user-data-dir={user_data_dir}",
         "--no-first-run",
         "--no-default-browser-check",
+        "--disable-background-networking",
+        "--disable-sync",
     ]
 
     # Windows needs different process creation flags
@@ -77,6 +86,7 @@ def start_cdp(port: int = 9222) -> None:
         kwargs["start_new_session"] = True
 
     proc = subprocess.Popen(cmd, **kwargs)
+    _cdp_process = proc
     try:
         with open(".cdp.pid", "w", encoding="utf-8") as handle:
             handle.write(str(proc.pid))
@@ -87,9 +97,52 @@ def start_cdp(port: int = 9222) -> None:
     print(f"✅ Chrome CDP started on port {port}")
 
 
+def _signal_cdp(proc: subprocess.Popen, force: bool = False) -> None:
+    if sys.platform.startswith("win"):
+        if force:
+            proc.kill()
+        else:
+            proc.terminate()
+    else:
+        # Chrome runs in its own session, so signal the whole process group
+        os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+
+
+def _cleanup_cdp() -> None:
+    """Terminate the Chrome CDP process started by `start_cdp`, if any."""
+    global _cdp_process
+    proc, _cdp_process = _cdp_process, None
+    if proc is None or proc.poll() is not None:
+        return
+    try:
+        _signal_cdp(proc)
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            _signal_cdp(proc, force=True)
+            proc.wait(timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    for marker in (".cdp.pid", ".cdp.profile"):
+        try:
+            os.remove(marker)
+        except OSError:
+            pass
+
+
 def start_server(host: str, port: int) -> None:
     from ui_app import app
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # uvloop is POSIX-only; Windows keeps the default asyncio loop
+    loop = "asyncio" if sys.platform.startswith("win") else "uvloop"
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        loop=loop,
+        http="httptools",
+        access_log=False,
+    )
 
 
 def main() -> None:
@@ -101,11 +154,19 @@ def main() -> None:
     os.environ.setdefault("SCRAPER_CDP_URL", f"http://127.0.0.1:{cdp_port}")
 
     start_cdp(cdp_port)
+    atexit.register(_cleanup_cdp)
+    # `stop` sends SIGTERM; turn it into SystemExit so cleanup still runs
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
 
     server_thread = Thread(target=start_server, args=(host, port), daemon=True)
     server_thread.start()
 
-    time.sleep(1)
+    # Open the UI as soon as the server is accepting connections
+    probe_host = "127.0.0.1" if host in ("0.0.0.0", "") else host
+    for _ in range(250):
+        if _tcp_port_open(probe_host, port, timeout=0.1):
+            break
+        time.sleep(0.02)
     ui_url = f"http://{host}:{port}"
     webbrowser.open(ui_url)
 
@@ -118,6 +179,8 @@ def main() -> None:
             time.sleep(1)
     except KeyboardInterrupt:
         print("\nShutting down...")
+    finally:
+        _cleanup_cdp()
 
 
 if __name__ == "__main__":
@@ -10,6 +10,21 @@ import asyncio
 import json
 from pathlib import Path
 from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from linkedin_scraper_pkg.browser import disable_api_stack_capture, run_event_loop
+from linkedin_scraper_pkg.cookies_auth import LOGGED_IN_URL_RE
+from linkedin_scraper_pkg.config import DEBUG
+
+if not DEBUG:
+    disable_api_stack_capture()
+
+LINKEDIN_COOKIE_URLS = ["https://www.linkedin.com", "https://www.linkedin.com/feed"]
+
+
+def _write_json(path: str, data) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
 
 
 async def main():
@@ -42,41 +57,24 @@ async def main():
     # Wait for user to log in - detect by URL change to feed or other logged-in page
     print("⏳ Waiting for login... (navigate to any LinkedIn page after login)")
     max_wait = 300  # 5 minutes
-    for i in range(max_wait):
-        await asyncio.sleep(2)
-        try:
-            url = page.url
-            # Check if we're on a logged-in page
-            if any(k in url for k in ["/feed", "/mynetwork", "/in/", "/messaging"]):
-                # Double check - look for feed content or nav bar
-                try:
-                    has_nav = await page.locator("[data-test-id='nav-bar'], nav.global-nav, #global-nav").count()
-                    if has_nav > 0 or "/feed" in url:
-                        print(f"\n✅ Login detected! (URL: {url[:60]})")
-                        break
-                except:
-                    pass
-            if "/authwall" not in url and "/login" not in url and "/signup" not in url and "/checkpoint" not in url:
-                # Might be logged in if not on auth pages
-                await asyncio.sleep(3)
-                url = page.url
-                if "/authwall" not in url and "/login" not in url:
-                    print(f"\n✅ Login detected! (URL: {url[:60]})")
-                    break
-        except Exception:
-            pass
-        if i % 15 == 0 and i > 0:
-            print(f"   Still waiting... ({i*2}s elapsed)")
+    try:
+        # Fires on the navigation commit instead of polling page.url
+        await page.wait_for_url(
+            LOGGED_IN_URL_RE,
+            timeout=max_wait * 1000,
+            wait_until="commit",
+        )
+        print(f"\n✅ Login detected! (URL: {page.url[:60]})")
+    except PlaywrightTimeoutError:
+        print(f"\n⚠️ Login not detected after {max_wait}s, saving current session anyway")
     
     # Wait a bit more for page to stabilize
     await asyncio.sleep(3)
     
-    # Also save cookies.json for backward compatibility
-    cookies = await context.cookies()
-    linkedin_cookies = [c for c in cookies if "linkedin.com" in c.get("domain", "")]
-    
-    with open("cookies.json", "w", encoding="utf-8") as f:
-        json.dump(linkedin_cookies, f, indent=2)
+    # Also save cookies.json for backward compatibility; Playwright filters
+    # to LinkedIn cookies itself and the write runs off the event loop
+    linkedin_cookies = await context.cookies(urls=LINKEDIN_COOKIE_URLS)
+    await asyncio.to_thread(_write_json, "cookies.json", linkedin_cookies)
     
     # Save auth_state.json
     await context.storage_state(path="auth_state.json")
@@ -92,4 +90,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
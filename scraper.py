@@ -18,28 +18,230 @@ import sys
 import json
 import argparse
 import re
+import traceback
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import Optional
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from linkedin_scraper_pkg.models import LinkedInRequest, CertificateItem
-from linkedin_scraper_pkg.browser import launch_browser, new_context, apply_stealth, connect_over_cdp, launch_persistent_context
-from linkedin_scraper_pkg.cookies_auth import load_cookies, apply_cookies, check_login_status
+from linkedin_scraper_pkg.browser import (
+    launch_browser,
+    new_context,
+    apply_stealth,
+    get_cdp_browser,
+    get_cdp_context,
+    get_persistent_context,
+    mark_session_warm,
+    wait_session_warm,
+    open_page,
+    run_event_loop,
+    close_browser,
+    disable_api_stack_capture,
+)
+from linkedin_scraper_pkg.cookies_auth import load_cookies, apply_cookies, check_login_status, AUTH_PAGE_URL_RE
 from linkedin_scraper_pkg.navigation import (
     goto_with_retry,
     navigate_via_js,
+    adaptive_wait,
     human_behavior,
     smooth_scroll_to,
     stabilize_detail_view,
+    wait_for_more_items,
     warm_up_scroll,
     deep_scroll,
-    random_delay,
 )
-from linkedin_scraper_pkg.selectors import find_cert_section, find_show_all_button
-from linkedin_scraper_pkg.extraction import extract_items, extract_new_layout_items
+from linkedin_scraper_pkg.selectors import (
+    find_cert_section,
+    find_show_all_button,
+    CERT_ANCHOR_SELECTOR,
+    CERT_ENTRY_SELECTOR,
+)
+from linkedin_scraper_pkg.extraction import extract_items, extract_items_tiered, extract_new_layout_items
 from linkedin_scraper_pkg.response import build_response, build_error
-from linkedin_scraper_pkg.config import COOKIES_FILE, random_user_agent, BLOCK_IMAGES, USE_CDP, CDP_URL
+from linkedin_scraper_pkg.config import (
+    COOKIES_FILE,
+    random_user_agent,
+    BLOCK_IMAGES,
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_URL_PARTS,
+    USE_CDP,
+    CDP_URL,
+    DEBUG,
+    MAX_PARALLEL_SCRAPES,
+)
 from linkedin_scraper_pkg import scraper_logging
 
+if not DEBUG:
+    disable_api_stack_capture()
+
+# Certifications / licenses details page
+_DETAIL_URL_RE = re.compile(r"details/(certifications|licenses)")
+
+# "Show more"-style buttons on detail pages (EN + ID), matched in-page by
+# _AUTOSCROLL_JS against button text and aria-label
+_SHOW_MORE_RE = re.compile(
+    r"show\s+more|show\s+all|show\s+more\s+results|see\s+more|tampilkan\s+lebih"
+    r"|load\s+more|muat\s+lebih|muat\s+selengkapnya"
+    r"|view\s+more",
+    re.I,
+)
+
+# Legacy detail-page certificate items under any of the known list roots
+_LEGACY_DETAIL_ITEM_SELECTOR = ", ".join(
+    f"{root} {item}"
+    for root in (
+        "main",
+        "main ul",
+        "main div[role='list']",
+        ".scaffold-finite-scroll__content",
+        ".pvs-list__outer-container",
+    )
+    for item in (
+        "li.pvs-list__paged-list-item",
+        "li.artdeco-list__item",
+        "div[data-view-name='profile-component-entity']",
+    )
+)
+
+# Whole details-page load loop in one call: every tick clicks any visible
+# "Show more"-style button (matched on text or aria-label against
+# `pattern`), scrolls `main` and the window to the bottom, and the promise
+# resolves with {count, clicks} once no item has been added under `main`
+# for `quietMs` (or `maxMs` passed). Clicks count as activity so a slow
+# response to a click does not end the loop early.
+_AUTOSCROLL_JS = """({pattern, quietMs, maxMs}) => new Promise(resolve => {
+    const re = new RegExp(pattern, 'i');
+    const LEGACY = "main li, main [role='listitem'], div[role='listitem']";
+    const SDUI = '[data-view-name="license-certifications-lockup-view"]';
+    const ITEM = "li, [role='listitem'], " + SDUI;
+    const count = () => Math.max(
+        document.querySelectorAll(LEGACY).length,
+        document.querySelectorAll(SDUI).length,
+    );
+    const visible = el => {
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const t0 = Date.now();
+    let lastAdd = t0;
+    let lastClick = 0;
+    let clicks = 0;
+    const obs = new MutationObserver(records => {
+        for (const r of records) {
+            for (const n of r.addedNodes) {
+                if (n.nodeType === 1 && (n.matches(ITEM) || n.querySelector(ITEM))) {
+                    lastAdd = Date.now();
+                    return;
+                }
+            }
+        }
+    });
+    obs.observe(document.querySelector('main') || document.body, {childList: true, subtree: true});
+    const iv = setInterval(() => {
+        const main = document.querySelector('main');
+        const now = Date.now();
+        // One click in flight at a time: re-scan only once the last click
+        // produced items (or clearly did nothing), so a loading button is
+        // not clicked again every tick
+        if (now - lastClick >= 1500 || lastAdd > lastClick) {
+            for (const b of (main || document).querySelectorAll('button')) {
+                const label = (b.innerText || '') + ' ' + (b.getAttribute('aria-label') || '');
+                if (!b.disabled && re.test(label) && visible(b)) {
+                    b.click();
+                    clicks++;
+                    lastAdd = lastClick = now;
+                    break;
+                }
+            }
+        }
+        if (main) main.scrollTop = main.scrollHeight;
+        window.scrollTo(0, document.body.scrollHeight);
+        if (now - lastAdd >= quietMs || now - t0 >= maxMs) {
+            clearInterval(iv);
+            obs.disconnect();
+            resolve({count: count(), clicks});
+        }
+    }, 300);
+})"""
+
+
+# Number of sections plus an 80-char preview (heading, else section text)
+# of the first `limit` of them, for the not-found debug message
+_SECTION_PREVIEWS_JS = """(limit) => {
+    const secs = document.querySelectorAll('section');
+    const previews = [];
+    for (const s of Array.from(secs).slice(0, limit)) {
+        const h = s.querySelector('h2, h3, header, span');
+        const text = ((h && h.innerText) || s.innerText || '').trim().replace(/\\n/g, ' ');
+        if (text) previews.push(text.slice(0, 80));
+    }
+    return [secs.length, previews];
+}"""
+
+# LinkedIn's "page doesn't exist" / "page not found" screen
+_PAGE_MISSING_JS = """() => {
+    if (location.pathname.includes('/404')) return true;
+    const t = (document.body ? document.body.innerText : '').toLowerCase();
+    return t.includes("page doesn't exist") || t.includes('page not found');
+}"""
+
+# Page-health snapshot in one round-trip: section count, length of the main
+# text (measured in-page rather than shipping the text over) and whether
+# LinkedIn rendered its generic "Something went wrong" error
+_PAGE_PROBE_JS = """() => {
+    const main = document.querySelector('main');
+    return {
+        sectionCount: document.querySelectorAll('section').length,
+        mainTextLen: main ? (main.innerText || '').trim().length : 0,
+        hasError: /something\\s+went\\s+wrong/i.test(document.body ? document.body.innerText : ''),
+    };
+}"""
+
+
+def _url_base(url: str) -> str:
+    """URL without query, fragment or trailing slash (for profile comparisons)."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}"
+
+
+def _is_empty_fallback(item: CertificateItem) -> bool:
+    """A fallback-scraped item with nothing but a name (likely not a certificate)."""
+    return (
+        not (item.issuer or item.issue_date or item.expiry_date or item.credential_id or item.verify_link)
+        and "fallback" in item.source.lower()
+    )
+
+
+def _read_json_file(path: Path):
+    """Parse a JSON file with orjson when available, else the stdlib json module."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
+
+
+def _dedup_by_name(items: list[CertificateItem]) -> list[CertificateItem]:
+    """Deduplicate certificates by name in one pass.
+
+    Later entries win ties; an entry with more of credential_id/verify_link
+    set beats one with fewer. Scores are stored with the kept entry so they
+    are not recomputed on every comparison.
+    """
+    best: dict[str, tuple[int, CertificateItem]] = {}
+    for c in items:
+        name = (c.certificate_name or "").strip()
+        if not name:
+            continue
+        score = (1 if c.credential_id else 0) + (1 if c.verify_link else 0)
+        prev = best.get(name)
+        if prev is None or score >= prev[0]:
+            best[name] = (score, c)
+    return [c for _, c in best.values()]
+
 
 async def scrape_linkedin(data: LinkedInRequest) -> dict:
     """
@@ -54,252 +256,258 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
     if not data.url or "linkedin.com" not in data.url:
         return {"url": data.url, "found": False, "error": "Invalid URL"}
 
-    extracted_certs = []
+    extracted_certs: list[CertificateItem] = []
     debug_msg = []
     cookies_loaded = False
+    is_guest = False
     debug_files = None
 
     browser = None
     context = None
+    owns_context = False
+    context_reused = False
+    warms_pool = False  # launched the pooled context; others wait on our warm-up
     page = None
+    # Secondary tabs / tasks used for concurrent fallbacks; closed in _cleanup
+    extra_pages = []
+    pending_tasks = []
+
+    # Profile URL without query/fragment; detail pages hang off this
+    base_url = _url_base(data.url)
+    detail_urls = (
+        f"{base_url}/details/certifications/",
+        f"{base_url}/details/licenses/",
+    )
+
+    def redirected_to_profile(tab=None) -> bool:
+        """Whether a details/ navigation bounced back to the main profile.
 
-    def merge_cert_lists(primary: list[dict], secondary: list[dict]) -> list[dict]:
+        LinkedIn does this when the profile has no such section, so the
+        remaining detail URLs would bounce the same way.
+        """
+        tab = tab or page
+        return _url_base(tab.url) == base_url
+
+    def merge_cert_lists(primary: list[CertificateItem], secondary: list[CertificateItem]) -> list[CertificateItem]:
         """Merge two certificate lists, deduplicating by certificate_name.
 
         Prefer entries that have credential_id or verify_link.
         """
-        combined = (primary or []) + (secondary or [])
-        dedup: dict[str, dict] = {}
-        for c in combined:
-            if not isinstance(c, dict):
-                continue
-            name = (c.get("certificate_name") or "").strip()
-            if not name:
-                continue
-            prev = dedup.get(name)
-            score = int(bool(c.get("credential_id"))) + int(bool(c.get("verify_link")))
-            prev_score = int(bool(prev and prev.get("credential_id"))) + int(bool(prev and prev.get("verify_link")))
-            if prev is None or score >= prev_score:
-                dedup[name] = c
-        return list(dedup.values())
-
-    async def extract_detail_items(label: str) -> list[dict]:
+        return _dedup_by_name((primary or []) + (secondary or []))
+
+    async def extract_detail_items(label: str, tab=None) -> list[CertificateItem]:
         """Extract detail items from multiple roots to handle layout changes."""
-        combined: list[dict] = []
+        tab = tab or page
+        combined: list[CertificateItem] = []
         
         # First try the new SDUI layout extraction (most reliable)
         try:
-            new_layout_items = await extract_new_layout_items(page, label)
+            new_layout_items = await extract_new_layout_items(tab, label)
             if new_layout_items:
                 print(f"      [extract_detail_items] {len(new_layout_items)} items from SDUI layout")
-                combined = [i.dict() for i in new_layout_items]
+                combined = new_layout_items
                 # SDUI extraction is authoritative; skip legacy fallbacks
                 return combined
         except Exception as e:
             print(f"      [extract_detail_items] SDUI extraction error: {e}")
         
-        # Legacy selectors as fallback only when SDUI found nothing
-        roots = [
-            page.locator("main"),
-            page.locator("main ul"),
-            page.locator("main div[role='list']"),
-            page.locator(".scaffold-finite-scroll__content"),
-            page.locator(".pvs-list__outer-container"),
-        ]
-        selectors = [
-            "li.pvs-list__paged-list-item",
-            "li.artdeco-list__item",
-            "div[data-view-name='profile-component-entity']",
-        ]
-        for root in roots:
-            for sel in selectors:
-                try:
-                    part = [
-                        i.dict()
-                        for i in await extract_items(
-                            page,
-                            sel,
-                            label,
-                            require_visible=False,
-                            root=root,
-                        )
-                    ]
-                    if part:
-                        print(f"      [extract_detail_items] {len(part)} items from legacy selector")
-                    combined = merge_cert_lists(combined, part)
-                except Exception:
-                    continue
+        # Legacy selectors as fallback only when SDUI found nothing. One union
+        # selector covers every root/item pairing; CSS matches each element
+        # once, so overlapping roots do not produce duplicates.
+        try:
+            part = await extract_items(
+                tab,
+                _LEGACY_DETAIL_ITEM_SELECTOR,
+                label,
+                require_visible=False,
+            )
+            if part:
+                print(f"      [extract_detail_items] {len(part)} items from legacy selector")
+            combined = merge_cert_lists(combined, part)
+        except Exception:
+            pass
         return combined
 
-    async def scroll_detail_until_stable(max_rounds: int = 12) -> None:
-        """Scroll likely containers until item count stops increasing."""
-        stable_rounds = 0
-        last_count = 0
-        
-        for rnd in range(max_rounds):
-            # Scroll both main container and body
-            try:
-                await page.evaluate("document.querySelector('main')?.scrollBy(0, 1500)")
-            except Exception:
-                pass
+    async def show_all_href(btn) -> str | None:
+        """Absolute href of a Show-all button whose click failed, if it has one.
+
+        Only read on that fallback path; click() scrolls the button into
+        view itself, so a successful click needs no extra round-trips.
+        """
+        try:
+            href = await btn.get_attribute("href", timeout=2000)
+        except Exception:
+            return None
+        if not href:
+            return None
+        return href if href.startswith("http") else f"https://www.linkedin.com{href}"
+
+    async def open_show_all_and_extract(section, label: str) -> tuple[bool, list[CertificateItem] | None]:
+        """Click the section's Show-all link and scrape the details page it opens.
+
+        Falls back to navigating to the link's href when the click fails, and
+        returns to the profile if the link led off LinkedIn. Returns whether
+        the link was followed and the extracted items, or None for the items
+        when no details page was reached.
+        """
+        show_all_btn = await find_show_all_button(section)
+        if not show_all_btn:
+            return False, None
+
+        print(f"   ℹ️ Found 'Show all' button, clicking ({label})...")
+        clicked = False
+        try:
+            current_url = page.url
             try:
-                await page.evaluate("window.scrollBy(0, 1500)")
+                await show_all_btn.click(timeout=min(12000, data.max_wait))
+                clicked = True
             except Exception:
-                pass
-            
-            await page.wait_for_timeout(600)
-            
-            # Count items: both legacy and SDUI
-            current = 0
+                full_href = await show_all_href(show_all_btn)
+                if full_href:
+                    clicked, _ = await navigate_via_js(page, full_href, timeout_ms=max(15000, data.max_wait))
+            if not clicked:
+                return False, None
+
+            # Go on as soon as the click lands on a details page (or leaves
+            # LinkedIn) instead of sleeping; readiness is judged below by
+            # the list itself, since DOMContentLoaded says nothing about
+            # whether the SDUI shell has rendered entries yet
             try:
-                legacy = await page.locator("main li, main [role='listitem'], div[role='listitem']").count()
-                sdui = await page.locator('[data-view-name="license-certifications-lockup-view"]').count()
-                current = max(legacy, sdui)
+                await page.wait_for_url(
+                    lambda u: "details/" in u or "linkedin.com" not in u,
+                    wait_until="commit",
+                    timeout=max(8000, data.max_wait // 3),
+                )
             except Exception:
                 pass
+
+            if "linkedin.com" not in page.url:
+                print(f"   🚫 External redirect detected: {page.url[:80]}")
+                debug_msg.append("ExternalRedirect")
+                await navigate_via_js(page, current_url, timeout_ms=15000)
+                await adaptive_wait(page, "miss")
+                return False, None
+
+            if "details/" not in page.url:
+                return True, None
+
+            # Details pages are only visited with a logged-in session, which
+            # LinkedIn does not re-challenge there; the profile visit already
+            # did the human-like pass, so go straight to loading the list
+            print(f"   ✓ Details page loaded: {page.url}")
+            if not await wait_for_more_items(page, 0, max(8000, data.max_wait // 3)):
+                try:
+                    await page.wait_for_load_state("domcontentloaded", timeout=5000)
+                except Exception:
+                    pass
+            await stabilize_detail_view(page, data.max_wait)
+            await autoscroll_detail(label, max_ms=40000)
+            detail_certs = await extract_detail_items("DetailView")
+            print(f"   Extracted {len(detail_certs)} certificates from detail page")
+            return True, detail_certs
+        except Exception as e:
+            print(f"   ⚠️ Show all click failed ({label}): {e}")
+            debug_msg.append(f"ShowAllError:{label}:{str(e)[:30]}")
+            return clicked, None
+
+    async def autoscroll_detail(label: str, max_ms: int = 60000, tab=None) -> None:
+        """Load the whole details list with one in-page scroll/expand loop.
+
+        Clicks "Show more" buttons and scrolls to the bottom until no items
+        have been added for 2s or `max_ms` passed (see `_AUTOSCROLL_JS`).
+        """
+        tab = tab or page
+        try:
+            loaded = await tab.evaluate(
+                _AUTOSCROLL_JS,
+                {"pattern": _SHOW_MORE_RE.pattern, "quietMs": 2000, "maxMs": max_ms},
+            )
+            print(f"      [{label}] Settled with {loaded['count']} items after {loaded['clicks']} clicks")
+            debug_msg.append(f"{label}Autoscroll:{loaded['count']}/{loaded['clicks']}")
+        except Exception as e:
+            print(f"      [{label}] Autoscroll error: {e}")
+
+    async def try_detail_fallback(tag: str, tab=None, parallel: bool = False) -> list[CertificateItem]:
+        """Navigate directly to details pages to capture full certificate list.
+
+        Runs on `tab` (default: the main page) so it can also be driven on a
+        separate tab concurrently with work on the main page. With
+        `parallel`, the certifications and licenses pages load at the same
+        time on two tabs and both are always scraped; otherwise they run in
+        turn and licenses is skipped once certifications yielded results.
+        """
+        tab = tab or page
+
+        async def _process(detail_url: str, t) -> tuple[list[CertificateItem], bool]:
+            """Scrape one details page; the flag is True if it bounced to the profile."""
+            print(f"      → Trying: {detail_url}")
+            ok2, err2 = await navigate_via_js(t, detail_url, timeout_ms=max(15000, data.max_wait))
+            if not ok2:
+                print(f"      ✗ Navigation failed: {err2}")
+                return [], False
+
+            # Quick check for error/404 pages, as soon as entries render
+            # (a missing page waits out the full 2s as before). A page with
+            # entries is not a 404; otherwise the text is searched in-page so
+            # only a boolean crosses the wire.
+            if not await wait_for_more_items(t, 0, 2000):
+                try:
+                    if await t.evaluate(_PAGE_MISSING_JS):
+                        print(f"      ✗ Page doesn't exist, skipping")
+                        debug_msg.append(f"Detail404:{detail_url.split('/')[-2]}")
+                        return [], False
+                except Exception:
+                    pass
             
-            print(f"      [scroll_detail] Round {rnd+1}: {current} items visible")
+            # Check if URL actually loaded (didn't redirect back to profile/feed)
+            if not ("details/" in t.url):
+                print(f"      ✗ Redirected away from detail page: {t.url}")
+                return [], redirected_to_profile(t)
             
-            if current == last_count:
-                stable_rounds += 1
-            else:
-                stable_rounds = 0
+            # No human_behavior pass here (see open_show_all_and_extract)
+            await stabilize_detail_view(t, data.max_wait)
             
-            last_count = current
+            # Moderate scrolling
+            await autoscroll_detail(tag, max_ms=20000, tab=t)
             
-            if stable_rounds >= 3:  # Wait for 3 stable rounds
-                print(f"      [scroll_detail] Stable after {rnd+1} rounds with {current} items")
-                break
-
-    async def expand_detail_list(max_clicks: int = 20) -> None:
-        """Click "Show more" / "Load more" buttons in detail pages to load additional items."""
-        consecutive_failures = 0
-        for i in range(max_clicks):
-            clicked = False
-            try:
-                # Try multiple button patterns - be very aggressive
-                patterns = [
-                    r"show\s+more|show\s+all|show\s+more\s+results|see\s+more|tampilkan\s+lebih",
-                    r"load\s+more|muat\s+lebih|muat\s+selengkapnya",
-                    r"view\s+more",
-                ]
-                for pattern in patterns:
-                    try:
-                        btns = page.get_by_role("button", name=re.compile(pattern, re.I))
-                        btn_count = await btns.count()
-                        if btn_count > 0:
-                            # Take the first visible button
-                            for j in range(btn_count):
-                                btn = btns.nth(j)
-                                try:
-                                    if await btn.is_visible():
-                                        await btn.scroll_into_view_if_needed()
-                                        await btn.click(timeout=8000)
-                                        print(f"      [expand_detail] Clicked button #{j} matching '{pattern}' (round {i+1})")
-                                        await page.wait_for_timeout(1500)
-                                        clicked = True
-                                        consecutive_failures = 0
-                                        break
-                                except:
-                                    continue
-                            if clicked:
-                                break
-                    except:
-                        continue
-                
-                if not clicked:
-                    # Also try finding by text content with more variations
+            detail_certs = await extract_detail_items(tag, t)
+            print(f"      ✓ Extracted {len(detail_certs)} certificates")
+            return detail_certs, False
+
+        results: list[CertificateItem] = []
+        try:
+            # A second tab only if one is free; otherwise walk the URLs in turn
+            second_tab = await open_page(context, wait=False) if parallel else None
+            if second_tab is not None:
+                extra_pages.append(second_tab)
+                try:
+                    await _wire_blockers(second_tab)
+                    outcomes = await asyncio.gather(
+                        _process(detail_urls[0], tab),
+                        _process(detail_urls[1], second_tab),
+                        return_exceptions=True,
+                    )
+                finally:
                     try:
-                        text_patterns = [
-                            "Load more", "Show more", "Show all", "View more",
-                            "Tampilkan lebih", "Muat lebih", "Lihat selengkapnya"
-                        ]
-                        for text_pat in text_patterns:
-                            load_more = page.locator(f"button:has-text('{text_pat}')")
-                            if await load_more.count() > 0:
-                                visible_count = 0
-                                for idx in range(await load_more.count()):
-                                    btn = load_more.nth(idx)
-                                    try:
-                                        if await btn.is_visible():
-                                            await btn.scroll_into_view_if_needed()
-                                            await btn.click(timeout=8000)
-                                            print(f"      [expand_detail] Clicked '{text_pat}' (round {i+1})")
-                                            await page.wait_for_timeout(1500)
-                                            clicked = True
-                                            consecutive_failures = 0
-                                            break
-                                    except:
-                                        continue
-                                if clicked:
-                                    break
-                    except:
+                        await second_tab.close()
+                    except Exception:
                         pass
-                
-                if not clicked:
-                    consecutive_failures += 1
-                    if consecutive_failures >= 2:
-                        print(f"      [expand_detail] No more buttons after {consecutive_failures} attempts, stopping")
-                        break
-            except Exception as e:
-                consecutive_failures += 1
-                print(f"      [expand_detail] Error: {e}")
-                if consecutive_failures >= 2:
-                    break
-
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        print(f"      ✗ Detail fallback error: {outcome}")
+                        debug_msg.append(f"DetailFallbackErr:{str(outcome)[:30]}")
+                        continue
+                    results = merge_cert_lists(results, outcome[0])
+                return results
 
-    async def try_detail_fallback(tag: str) -> list[dict]:
-        """Navigate directly to details pages to capture full certificate list."""
-        results: list[dict] = []
-        try:
-            base_url = re.sub(r"[?#].*", "", data.url).rstrip("/")
-            detail_urls = [
-                f"{base_url}/details/certifications/",
-                f"{base_url}/details/licenses/",
-            ]
             for detail_url in detail_urls:
                 # Skip licenses page if certifications page already found results
                 if results and "licenses" in detail_url:
                     print(f"      → Skipping {detail_url} (already found {len(results)} certs)")
                     break
-                
-                print(f"      → Trying: {detail_url}")
-                ok2, err2 = await navigate_via_js(page, detail_url, timeout_ms=max(15000, data.max_wait))
-                if not ok2:
-                    print(f"      ✗ Navigation failed: {err2}")
-                    continue
-
-                # Quick check for error/404 pages
-                await page.wait_for_timeout(2000)
-                try:
-                    body_text = await page.locator("body").inner_text()
-                    if "page doesn't exist" in body_text.lower() or "page not found" in body_text.lower():
-                        print(f"      ✗ Page doesn't exist, skipping")
-                        debug_msg.append(f"Detail404:{detail_url.split('/')[-2]}")
-                        continue
-                except Exception:
-                    pass
-                
-                # Check if URL actually loaded (didn't redirect back to profile/feed)
-                if not ("details/" in page.url):
-                    print(f"      ✗ Redirected away from detail page: {page.url}")
-                    continue
-                
-                await human_behavior(page)
-                await stabilize_detail_view(page, data.max_wait)
-                
-                # Moderate scrolling
-                for scroll_round in range(2):
-                    await scroll_detail_until_stable(max_rounds=6)
-                    await expand_detail_list(max_clicks=10)
-                    await page.wait_for_timeout(600)
-                
-                # Final scroll to bottom
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1000)
-                
-                detail_certs = await extract_detail_items(tag)
-                print(f"      ✓ Extracted {len(detail_certs)} certificates")
+                detail_certs, bounced = await _process(detail_url, tab)
+                if bounced:
+                    break
                 if detail_certs:
                     results = merge_cert_lists(results, detail_certs)
         except Exception as e:
@@ -307,6 +515,24 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             debug_msg.append(f"DetailFallbackErr:{str(e)[:30]}")
         return results
 
+    async def _import_file_cookies(auth_state_file: Path | None = None, ctx=None) -> None:
+        """Add cookies from auth_state.json (when given and present) or cookies.json."""
+        nonlocal cookies_loaded
+        ctx = ctx or context
+        try:
+            if auth_state_file is not None and auth_state_file.exists():
+                state = await asyncio.to_thread(_read_json_file, auth_state_file)
+                if state.get("cookies"):
+                    await ctx.add_cookies(state["cookies"])
+                    debug_msg.append("AUTH_STATE_LOADED")
+            else:
+                cookies = await load_cookies(COOKIES_FILE)
+                cookies_loaded, has_li_at = await apply_cookies(ctx, cookies)
+                if not has_li_at:
+                    print("⚠️ WARNING: li_at cookie not found. Auth will likely fail.")
+        except Exception as e:
+            print(f"⚠️ Cookie load error: {e}")
+
     # Decide whether to use CDP (real Chrome) or Playwright-launched Chromium
     use_cdp = USE_CDP or getattr(data, "use_cdp", False)
     cdp_url = getattr(data, "cdp_url", None) or CDP_URL
@@ -314,8 +540,8 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
     if use_cdp:
         print(f"🚀 Connecting via CDP: {cdp_url}")
         try:
-            browser = await connect_over_cdp(cdp_url)
-            context = browser.contexts[0] if browser.contexts else await browser.new_context()
+            browser = await get_cdp_browser(cdp_url)
+            context = await get_cdp_context(cdp_url)
             debug_msg.append("CDP_MODE")
         except Exception as e:
             print(f"❌ CDP connection failed: {e}. Falling back to launch_browser")
@@ -328,36 +554,35 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
         auth_state_file = Path("auth_state.json")
         use_persistent = True
 
+        async def _first_launch_setup(ctx) -> None:
+            # Stealth scripts and cookies from file (first-time setup only)
+            # are independent context calls, so issue them together
+            setup = [apply_stealth(ctx)]
+            if not (user_data_dir / "Default" / "Cookies").exists():
+                setup.append(_import_file_cookies(auth_state_file, ctx))
+            await asyncio.gather(*setup)
+
         try:
-            context = await launch_persistent_context(
+            # Setup runs inside the pool lock, so scrapes that arrive while the
+            # context is launching get it only once stealth and cookies are in
+            context, launched = await get_persistent_context(
                 str(user_data_dir),
                 headless=(data.headless if data.headless is not None else True),
                 proxy=data.proxy,
+                setup=_first_launch_setup,
             )
-            await apply_stealth(context)
+            # Shared across calls: only our pages are closed in _cleanup
+            owns_context = False
             browser = None  # persistent context does not have a separate browser
             cookies_loaded = True
-
-            # Also apply cookies from file if they exist (for first-time setup)
-            if not (user_data_dir / "Default" / "Cookies").exists():
-                try:
-                    if auth_state_file.exists():
-                        import json as _json
-                        with open(auth_state_file) as _f:
-                            state = _json.load(_f)
-                        if state.get("cookies"):
-                            await context.add_cookies(state["cookies"])
-                            debug_msg.append("AUTH_STATE_LOADED")
-                    else:
-                        cookies = await load_cookies(COOKIES_FILE)
-                        cookies_loaded, has_li_at = await apply_cookies(context, cookies)
-                        if not has_li_at:
-                            print("⚠️ WARNING: li_at cookie not found. Auth will likely fail.")
-                except Exception as e:
-                    print(f"⚠️ Cookie load error: {e}")
+            warms_pool = launched
+            if not launched:
+                context_reused = True
+                debug_msg.append("CONTEXT_REUSED")
         except Exception as e:
             print(f"⚠️ Persistent context failed: {e}, falling back to regular browser")
             use_persistent = False
+            owns_context = True
             browser = await launch_browser(headless=(data.headless if data.headless is not None else True), proxy=data.proxy)
             if auth_state_file.exists():
                 context = await browser.new_context(
@@ -372,31 +597,38 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
                 debug_msg.append("AUTH_STATE_LOADED_FALLBACK")
             else:
                 context = await new_context(browser, locale="en-US", timezone_id="Asia/Jakarta", user_agent=random_user_agent())
-                await apply_stealth(context)
-                try:
-                    cookies = await load_cookies(COOKIES_FILE)
-                    cookies_loaded, has_li_at = await apply_cookies(context, cookies)
-                    if not has_li_at:
-                        print("⚠️ WARNING: li_at cookie not found. Auth will likely fail.")
-                except Exception as e:
-                    print(f"⚠️ Cookie load error: {e}")
+                await asyncio.gather(apply_stealth(context), _import_file_cookies())
 
     async def _wire_blockers(p):
+        # Certificates are read from DOM text and links only, so images, fonts,
+        # media and tracking beacons are pure overhead on every navigation.
+        # Routed per page (not per context) so a CDP-attached Chrome keeps
+        # loading normally in the user's own tabs.
         if BLOCK_IMAGES and not data.debug:
             from playwright.async_api import Route
-            async def _block_images(route: Route):
-                await route.abort()
-            await p.route("**/*.{png,jpg,jpeg,gif,svg,ico}", _block_images)
+            async def _block_resources(route: Route):
+                req = route.request
+                if req.resource_type in BLOCKED_RESOURCE_TYPES or any(h in req.url for h in BLOCKED_URL_PARTS):
+                    await route.abort()
+                else:
+                    await route.continue_()
+            await p.route("**/*", _block_resources)
 
     async def _cleanup():
-        # Always close the tab; close whole browser only when we launched it
-        try:
-            if page:
-                await page.close()
-        except Exception:
-            pass
+        # Never leave reusing scrapes waiting on a warm-up that will not finish
+        if warms_pool:
+            mark_session_warm()
+        # Always close the tab(s); close whole browser only when we launched it
+        for task in pending_tasks:
+            task.cancel()
+        for p in [page, *extra_pages]:
+            try:
+                if p:
+                    await p.close()
+            except Exception:
+                pass
         try:
-            if context:
+            if context and owns_context:
                 await context.close()
         except Exception:
             pass
@@ -407,25 +639,39 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             except Exception:
                 pass
 
-    page = await context.new_page()
+    page = await open_page(context)
     await _wire_blockers(page)
 
     try:
-        # Warm-up: visit LinkedIn feed first to establish session before profile
-        print("🔑 Establishing LinkedIn session...")
-        try:
-            await page.goto("https://www.linkedin.com/feed/", timeout=max(15000, data.max_wait), wait_until="domcontentloaded")
-            await page.wait_for_timeout(2000)
-            # Check if we ended up on authwall/login
-            if any(k in page.url for k in ["authwall", "/login", "/signup"]):
-                print("⚠️ Session warm-up hit authwall, continuing anyway...")
-                debug_msg.append("WARMUP_AUTHWALL")
-            else:
-                print("✅ Session established")
-                debug_msg.append("SESSION_OK")
-        except Exception as e:
-            print(f"⚠️ Session warm-up failed: {e}")
-            debug_msg.append(f"WARMUP_ERR:{str(e)[:30]}")
+        # Warm-up: visit LinkedIn feed first to establish session before profile.
+        # A reused persistent context already did this on an earlier scrape.
+        if context_reused:
+            # A context launched moments ago may still be on its feed warm-up
+            await wait_session_warm(15)
+            debug_msg.append("SESSION_REUSED")
+        else:
+            print("🔑 Establishing LinkedIn session...")
+            try:
+                # Only the session cookies matter here: the auth redirect is decided
+                # server-side, so a slow feed render is not worth waiting out
+                try:
+                    await page.goto("https://www.linkedin.com/feed/", timeout=8000, wait_until="domcontentloaded")
+                except PlaywrightTimeoutError:
+                    if page.url in ("", "about:blank"):
+                        raise
+                # Check if we ended up on authwall/login
+                if AUTH_PAGE_URL_RE.search(page.url):
+                    print("⚠️ Session warm-up hit authwall, continuing anyway...")
+                    debug_msg.append("WARMUP_AUTHWALL")
+                else:
+                    print("✅ Session established")
+                    debug_msg.append("SESSION_OK")
+                    await adaptive_wait(page, "ok")
+            except Exception as e:
+                print(f"⚠️ Session warm-up failed: {e}")
+                debug_msg.append(f"WARMUP_ERR:{str(e)[:30]}")
+            if warms_pool:
+                mark_session_warm()
 
         print(f"🚀 Opening: {data.url}")
 
@@ -441,10 +687,10 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
                 return build_error(data, f"Navigation failed: {err}", debug_msg)
 
         # If redirected away from target, retry
-        if any(k in page.url for k in ["authwall", "/login", "/signup"]) or ("/feed" in page.url and "/in/" in data.url):
+        if AUTH_PAGE_URL_RE.search(page.url) or ("/feed" in page.url and "/in/" in data.url):
             print("⚠️ Redirected away from profile, retrying...")
             debug_msg.append("REDIRECT_RETRY")
-            await page.wait_for_timeout(2000)
+            await adaptive_wait(page, "authwall")
             ok, err = await navigate_via_js(page, data.url, timeout_ms=max(20000, data.max_wait))
             if not ok:
                 print(f"❌ Retry navigation failed: {err}")
@@ -453,21 +699,16 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
         if data.debug:
             await scraper_logging.save_debug_files(page, "landing")
 
-        # Wait a bit for page to stabilize
-        await page.wait_for_timeout(2000)
+        # Let the profile document settle (returns early once it is complete)
+        await adaptive_wait(page, "ok")
 
         # Detect empty/blocked DOM early and fallback to CDP when available
         dom_empty = False
         try:
-            sec_count = await page.locator("section").count()
-            main_text = ""
-            try:
-                main_text = await page.locator("main").inner_text()
-            except Exception:
-                pass
-            if sec_count == 0 or len(main_text.strip()) < 20:
+            probe = await page.evaluate(_PAGE_PROBE_JS)
+            if probe["sectionCount"] == 0 or probe["mainTextLen"] < 20:
                 dom_empty = True
-                print(f"⚠️ DOM appears empty (sections: {sec_count}, main_text: {len(main_text)})")
+                print(f"⚠️ DOM appears empty (sections: {probe['sectionCount']}, main_text: {probe['mainTextLen']})")
         except Exception:
             pass
 
@@ -476,10 +717,13 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             print("⚠️ DOM appears empty/blocked")
             if not use_cdp and USE_CDP:
                 print("🔄 Retrying via CDP failover...")
-                await browser.close()
-                browser = await connect_over_cdp(cdp_url)
-                context = browser.contexts[0] if browser.contexts else await browser.new_context()
-                page = await context.new_page()
+                await page.close()
+                if browser:
+                    await browser.close()
+                browser = await get_cdp_browser(cdp_url)
+                context = await get_cdp_context(cdp_url)
+                owns_context = False
+                page = await open_page(context)
                 await _wire_blockers(page)
                 use_cdp = True
                 debug_msg.append("CDP_FAILOVER")
@@ -511,13 +755,7 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
         await deep_scroll(page)
 
         # Direct detail-page handling to avoid missing items on /details pages
-        import re
-        is_detail_url = any(
-            k in page.url or k in data.url for k in [
-                "details/certifications",
-                "details/licenses",
-            ]
-        )
+        is_detail_url = bool(_DETAIL_URL_RE.search(page.url) or _DETAIL_URL_RE.search(data.url))
         if is_detail_url:
             try:
                 await stabilize_detail_view(page, data.max_wait)
@@ -529,62 +767,26 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
                 except Exception:
                     debug_msg.append("DetailDirect:WaitTimeout")
 
-                # Very aggressive scrolling
+                # Scroll and expand in-page until the list stops growing
                 print("   🔄 Aggressive detail page scrolling...")
-                for scroll_round in range(8):
-                    print(f"   [DetailDirect Scroll {scroll_round+1}/8]")
-                    await scroll_detail_until_stable(max_rounds=20)
-                    await expand_detail_list(max_clicks=15)
-                    await page.wait_for_timeout(700)
-                
-                # Final bottom scroll
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1200)
-                
-                for _ in range(10):
-                    await page.evaluate("document.querySelector('main')?.scrollBy(0, 2000)")
-                    await page.wait_for_timeout(400)
+                await autoscroll_detail("Detail", max_ms=60000)
 
-                # Extract from all main > ul lists
+                # Extract the list items under main > ul in one snapshot,
+                # preferring paged-list / artdeco items over bare (nested) li
                 extracted_certs = []
-                uls = page.locator("main ul")
                 try:
-                    ul_count = await uls.count()
-                    debug_msg.append(f"DetailULs:{ul_count}")
-                except Exception:
-                    ul_count = 0
-                for i_ul in range(ul_count):
-                    root_ul = uls.nth(i_ul)
-                    try:
-                        part = [
-                            i.dict()
-                            for i in await extract_items(
-                                page,
-                                "li",
-                                "DetailDirect",
-                                require_visible=False,
-                                root=root_ul,
-                            )
-                        ]
-                        if part:
-                            extracted_certs.extend(part)
-                    except Exception:
-                        continue
+                    extracted_certs = await extract_items(
+                        page,
+                        "li",
+                        "DetailDirect",
+                        require_visible=False,
+                        root=page.locator("main ul"),
+                    )
+                except Exception as e:
+                    print(f"   [DetailDirect] Extraction error: {e}")
 
                 # Deduplicate by certificate_name
-                if extracted_certs:
-                    dedup = {}
-                    for c in extracted_certs:
-                        name = c.get("certificate_name") or ""
-                        if not name:
-                            continue
-                        # prefer entries with credential_id or verify_link
-                        prev = dedup.get(name)
-                        score = int(bool(c.get("credential_id"))) + int(bool(c.get("verify_link")))
-                        prev_score = int(bool(prev and prev.get("credential_id"))) + int(bool(prev and prev.get("verify_link")))
-                        if prev is None or score >= prev_score:
-                            dedup[name] = c
-                    extracted_certs = list(dedup.values())
+                extracted_certs = _dedup_by_name(extracted_certs)
 
                 debug_msg.append(f"DetailDirect:{len(extracted_certs)}")
             except Exception as e:
@@ -597,7 +799,7 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             print(f"✅ Scraping complete (detail direct): {len(extracted_certs)} certificates found")
             return build_response(
                 data,
-                [CertificateItem(**i) for i in extracted_certs],
+                extracted_certs,
                 cookies_loaded,
                 is_guest,
                 debug_msg,
@@ -612,36 +814,33 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
 
         # If detail_only requested, jump straight to detail pages
         if not is_guest and data.detail_only:
-            base_url = re.sub(r"[?#].*", "", data.url).rstrip("/")
-            for detail_url in [f"{base_url}/details/certifications/", f"{base_url}/details/licenses/"]:
+            for detail_url in detail_urls:
                 try:
                     await navigate_via_js(page, detail_url, timeout_ms=max(20000, data.max_wait))
-                    await random_delay(2, 4)
+                    await adaptive_wait(page, "ok")
                     debug_msg.append("Jump:DetailOnly")
                     break
                 except Exception:
                     continue
 
         section, strat = await find_cert_section(page)
+        try:
+            probe = await page.evaluate(_PAGE_PROBE_JS)
+        except Exception:
+            probe = {"sectionCount": 0, "mainTextLen": 0, "hasError": False}
         if section:
             section_found = True
             debug_msg.append(f"FindSection:{strat}")
         else:
-            try:
-                section_count = await page.locator("section").count()
-                print(f"   Sections available before retry: {section_count}")
-                debug_msg.append(f"SectionCount:{section_count}")
-            except Exception:
-                pass
+            print(f"   Sections available before retry: {probe['sectionCount']}")
+            debug_msg.append(f"SectionCount:{probe['sectionCount']}")
 
         # Early error-page detection (e.g., "Something went wrong")
         try:
-            err_locator = page.get_by_text("Something went wrong", exact=False)
-            if await err_locator.count() > 0:
+            if probe["hasError"]:
                 debug_msg.append("ErrorPage:SomethingWentWrong")
                 if data.debug:
                     await scraper_logging.save_debug_files(page, "error_page")
-                await browser.close()
                 return build_error(data, "LinkedIn returned an error page (possible block/authwall)", debug_msg)
         except Exception:
             pass
@@ -654,12 +853,21 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
 
             scraped_details = False
 
+            # The section shell can render before its entries; wait for the
+            # first one rather than treating a lazy list as empty
+            try:
+                await section.locator(CERT_ENTRY_SELECTOR).first.wait_for(state="attached", timeout=min(8000, data.max_wait))
+            except PlaywrightTimeoutError:
+                debug_msg.append("MainView:NoEntriesYet")
+            except Exception:
+                pass
+
             # Try SDUI extraction first (most reliable on new LinkedIn layout)
             print("   Scraping from main section...")
             try:
                 sdui_main = await extract_new_layout_items(page, "MainView")
                 if sdui_main:
-                    extracted_certs = [i.dict() for i in sdui_main]
+                    extracted_certs = sdui_main
                     print(f"   Got {len(extracted_certs)} certificates from MainView (SDUI)")
                     debug_msg.append(f"Scraped:MainViewSDUI:{len(extracted_certs)}")
             except Exception as e:
@@ -668,101 +876,35 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             # Fallback to legacy selectors if SDUI found nothing
             if not extracted_certs:
                 try:
-                    extracted_certs = [
-                        i.dict() for i in await extract_items(page, "li, div[data-view-name='profile-component-entity']", "MainView", root=section, require_visible=False)
-                    ]
+                    extracted_certs = await extract_items(page, "li, div[data-view-name='profile-component-entity']", "MainView", root=section, require_visible=False)
                     print(f"   Got {len(extracted_certs)} certificates from MainView (legacy)")
                     debug_msg.append(f"Scraped:MainView:{len(extracted_certs)}")
                 except Exception as e:
                     print(f"   ⚠️ MainView extraction failed: {e}")
                     debug_msg.append(f"MainViewError:{str(e)[:30]}")
 
-            # Check if there's a "Show all" button indicating more certificates exist
-            has_show_all_btn = False
-            if not is_guest:
-                try:
-                    show_all_btn = await find_show_all_button(section)
-                    has_show_all_btn = show_all_btn and await show_all_btn.count() > 0
-                except Exception:
-                    has_show_all_btn = False
-
             # ALWAYS try to get full list from details page when logged in
             # Main view typically only shows 3-4 certificates
             if not is_guest:
                 print("   🔄 Navigating to details page for full certificate list...")
                 
                 # First try: click show-all button if found
-                show_all_btn = await find_show_all_button(section)
-                clicked_show_all = False
-
-                if show_all_btn and await show_all_btn.count() > 0:
-                    print(f"   ℹ️ Found 'Show all' button, clicking...")
-                    try:
-                        current_url = page.url
-                        href_backup = await show_all_btn.get_attribute("href")
-                        await show_all_btn.scroll_into_view_if_needed()
-                        try:
-                            await show_all_btn.click(timeout=min(12000, data.max_wait))
-                            clicked_show_all = True
-                        except Exception:
-                            if href_backup:
-                                full_href = href_backup if href_backup.startswith("http") else f"https://www.linkedin.com{href_backup}"
-                                ok_nav, _ = await navigate_via_js(page, full_href, timeout_ms=max(15000, data.max_wait))
-                                clicked_show_all = ok_nav
-                        
-                        if clicked_show_all:
-                            try:
-                                await page.wait_for_load_state("domcontentloaded", timeout=max(10000, data.max_wait // 2))
-                            except Exception:
-                                pass
-                            
-                            await page.wait_for_timeout(2000)
-
-                            # Check if redirected to external domain
-                            if "linkedin.com" not in page.url:
-                                print(f"   🚫 External redirect detected: {page.url[:80]}")
-                                debug_msg.append("ExternalRedirect")
-                                ok_back, _ = await navigate_via_js(page, current_url, timeout_ms=15000)
-                                await page.wait_for_timeout(1500)
-                                clicked_show_all = False
-                    except Exception as e:
-                        print(f"   ⚠️ Show all click failed: {e}")
-                        debug_msg.append(f"ShowAllError: {str(e)[:30]}")
-                        clicked_show_all = False
-                
-                # If click worked and we're on details page, extract from it
-                if clicked_show_all and "details/" in page.url:
-                    print(f"   ✓ Details page loaded: {page.url}")
-                    await human_behavior(page)
-                    await stabilize_detail_view(page, data.max_wait)
-                    
-                    for scroll_round in range(4):
-                        await scroll_detail_until_stable(max_rounds=10)
-                        await expand_detail_list(max_clicks=10)
-                        await page.wait_for_timeout(600)
-                    
-                    # Extra scrolls to bottom to ensure lazy-loaded items appear
-                    for _ in range(5):
-                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        await page.wait_for_timeout(800)
-                    
-                    detail_certs = await extract_detail_items("DetailView")
-                    print(f"   Extracted {len(detail_certs)} certificates from detail page")
+                clicked_show_all, detail_certs = await open_show_all_and_extract(section, "DetailView")
+                if detail_certs is not None:
                     extracted_certs = merge_cert_lists(extracted_certs, detail_certs)
                     scraped_details = True
                     debug_msg.append(f"Scraped:DetailView:{len(detail_certs)}")
-                
                 # If click worked but URL didn't change to details, try SDUI on current page
                 elif clicked_show_all:
                     print(f"   Show all clicked, URL: {page.url}")
-                    await page.wait_for_timeout(2000)
+                    await adaptive_wait(page, "miss")
                     await human_behavior(page)
                     
                     # Try SDUI extraction on current page (might have loaded more items)
                     try:
                         sdui_post_click = await extract_new_layout_items(page, "PostClick")
                         if sdui_post_click:
-                            post_click_certs = [i.dict() for i in sdui_post_click]
+                            post_click_certs = sdui_post_click
                             print(f"   Got {len(post_click_certs)} certs after Show All click (SDUI)")
                             extracted_certs = merge_cert_lists(extracted_certs, post_click_certs)
                             scraped_details = True
@@ -773,7 +915,7 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
                 # Fallback: direct navigation to details page
                 if not scraped_details:
                     print("   ↪️ Directly navigating to details page...")
-                    detail_certs = await try_detail_fallback("DetailDirect")
+                    detail_certs = await try_detail_fallback("DetailDirect", parallel=True)
                     if detail_certs:
                         extracted_certs = merge_cert_lists(extracted_certs, detail_certs)
                         scraped_details = True
@@ -783,15 +925,16 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             if not scraped_details and not extracted_certs:
                 print("   Scraping from main section (fallback)...")
                 if section:
-                    extracted_certs = [
-                        i.dict() for i in await extract_items(page, "li, div[data-view-name='profile-component-entity']", "MainViewFallback", root=section, require_visible=False)
-                    ]
-                    debug_msg.append(f"Scraped:MainViewFallback:{len(extracted_certs)}")
-                    if not extracted_certs:
-                        extracted_certs = [
-                            i.dict() for i in await extract_items(page, "li, div", "MainViewWideFallback", root=section, require_visible=False)
-                        ]
-                        debug_msg.append(f"Scraped:MainViewWideFallback:{len(extracted_certs)}")
+                    extracted_certs, used = await extract_items_tiered(
+                        page,
+                        "li, div[data-view-name='profile-component-entity']",
+                        "li, div",
+                        "MainViewFallback",
+                        "MainViewWideFallback",
+                        root=section,
+                        require_visible=False,
+                    )
+                    debug_msg.append(f"Scraped:{used}:{len(extracted_certs)}")
                 else:
                     print("   ⚠️ No section found to scrape from")
                     debug_msg.append("NoSectionToScrape")
@@ -799,8 +942,24 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
             print("❌ Certificate section not found!")
             debug_msg.append("SECTION_NOT_FOUND")
 
-            # Retry after a deeper scroll in case the section was loaded late
-            await deep_scroll(page, steps=8)
+            # The detail pages do not depend on the profile DOM, so when logged
+            # in, load them on a second tab while the main tab retries below
+            detail_task = None
+            detail_tab = await open_page(context, wait=False) if not is_guest else None
+            if detail_tab is not None:
+                print(f"🔄 Trying fallback detail URLs under: {base_url}")
+                extra_pages.append(detail_tab)
+                await _wire_blockers(detail_tab)
+                detail_task = asyncio.create_task(try_detail_fallback("DetailFallback", detail_tab, parallel=True))
+                pending_tasks.append(detail_task)
+
+            # Retry in case the section was loaded late: give it a moment to
+            # attach, and only pay for the deeper scroll if it still has not
+            scraped_details = False
+            try:
+                await page.locator(CERT_ANCHOR_SELECTOR).first.wait_for(state="attached", timeout=3000)
+            except Exception:
+                await deep_scroll(page, steps=8)
             section_retry, strat_retry = await find_cert_section(page)
             if section_retry:
                 section = section_retry
@@ -808,145 +967,54 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
                 debug_msg.append(f"RetryFindSection:{strat_retry}")
                 print("✅ Certificate section found after retry!")
                 await smooth_scroll_to(page, section)
-                scraped_details = False
 
                 if not is_guest:
-                    show_all_btn = await find_show_all_button(section)
-
-                    if show_all_btn and await show_all_btn.count() > 0:
-                        print("🔥 Attempting to expand details (retry)...")
-                        try:
-                            href_backup = await show_all_btn.get_attribute("href")
-                            await show_all_btn.scroll_into_view_if_needed()
-                            try:
-                                await show_all_btn.click(timeout=min(8000, data.max_wait))
-                            except Exception:
-                                if href_backup:
-                                    await page.goto(
-                                        f"https://www.linkedin.com{href_backup}",
-                                        timeout=max(12000, data.max_wait // 2),
-                                    )
-                            # Use domcontentloaded instead of networkidle
-                            try:
-                                await page.wait_for_load_state("domcontentloaded", timeout=max(8000, data.max_wait // 3))
-                            except Exception:
-                                print(f"⚠️ Page load timeout (retry), continuing anyway...")
-                                debug_msg.append("PageLoadTimeoutRetry")
-                            
-                            await page.wait_for_timeout(1500)
-
-                            if "details/certifications" in page.url or "details/licenses" in page.url:
-                                print("   ✓ Details page loaded (retry)")
-                                await human_behavior(page)
-                                await stabilize_detail_view(page, data.max_wait)
-                                await expand_detail_list()
-                                await scroll_detail_until_stable()
-                                detail_certs = await extract_detail_items("DetailView")
-                                extracted_certs = merge_cert_lists(extracted_certs, detail_certs)
-                                scraped_details = True
-                                debug_msg.append("Scraped:DetailViewRetry")
-                                if data.debug and not extracted_certs:
-                                    await scraper_logging.save_debug_files(page, "detail_empty_retry")
-                            else:
-                                if "details/" in page.url:
-                                    await human_behavior(page)
-                                    await stabilize_detail_view(page, data.max_wait)
-                                    await expand_detail_list()
-                                    await scroll_detail_until_stable()
-                                    detail_certs = await extract_detail_items("DetailView")
-                                    extracted_certs = merge_cert_lists(extracted_certs, detail_certs)
-                                    scraped_details = True
-                                    debug_msg.append("Scraped:DetailViewRetry-NoClick")
-                        except Exception as e:
-                            print(f"   ⚠️ Show all click failed (retry): {e}")
-                            debug_msg.append(f"ShowAllErrorRetry:{str(e)[:30]}")
+                    _, detail_certs = await open_show_all_and_extract(section, "DetailViewRetry")
+                    if detail_certs is not None:
+                        extracted_certs = merge_cert_lists(extracted_certs, detail_certs)
+                        scraped_details = True
+                        debug_msg.append(f"Scraped:DetailViewRetry:{len(detail_certs)}")
+                        if data.debug and not extracted_certs:
+                            await scraper_logging.save_debug_files(page, "detail_empty_retry")
 
                 if not scraped_details:
                     print("   Scraping from main section (retry)...")
                     if section:
-                        extracted_certs = [
-                            i.dict() for i in await extract_items(page, "li, div[data-view-name='profile-component-entity']", "MainViewRetry", root=section, require_visible=False)
-                        ]
-                        debug_msg.append(f"Scraped:MainViewRetry:{len(extracted_certs)}")
-                        if not extracted_certs:
-                            extracted_certs = [
-                                i.dict() for i in await extract_items(page, "li, div", "MainViewRetryWide", root=section, require_visible=False)
-                            ]
-                            debug_msg.append(f"Scraped:MainViewRetryWide:{len(extracted_certs)}")
-
-            # If still not found, continue with detail fallback below
-
-            # Fallback: force navigate to details/certifications when logged in
+                        extracted_certs, used = await extract_items_tiered(
+                            page,
+                            "li, div[data-view-name='profile-component-entity']",
+                            "li, div",
+                            "MainViewRetry",
+                            "MainViewRetryWide",
+                            root=section,
+                            require_visible=False,
+                        )
+                        debug_msg.append(f"Scraped:{used}:{len(extracted_certs)}")
+
+            # Detail-page fallback was started on its own tab above, or runs
+            # here on the main tab when the tab cap left no room for one
             if not is_guest:
-                try:
-                    base_url = re.sub(r"[?#].*", "", data.url).rstrip("/")
-                    detail_urls = [
-                        f"{base_url}/details/certifications/",
-                        f"{base_url}/details/licenses/"
-                    ]
-                    for detail_url in detail_urls:
-                        # Skip licenses if certifications already found
-                        if extracted_certs and "licenses" in detail_url:
-                            break
-                        
-                        print(f"🔄 Trying fallback URL: {detail_url}")
-                        try:
-                            ok2, err2 = await navigate_via_js(page, detail_url, timeout_ms=max(15000, data.max_wait))
-                            if not ok2:
-                                continue
-                            # Quick check for 404 / "page doesn't exist"
-                            await page.wait_for_timeout(2000)
-                            try:
-                                body_text = await page.locator("body").inner_text()
-                                if "page doesn't exist" in body_text.lower() or "page not found" in body_text.lower():
-                                    print(f"   Page doesn't exist, skipping")
-                                    continue
-                            except Exception:
-                                pass
-                            
-                            if "details/" not in page.url:
-                                print(f"   Redirected away: {page.url}")
-                                continue
-                            
-                            await human_behavior(page)
-                            await stabilize_detail_view(page, data.max_wait)
-                            await expand_detail_list()
-                            await scroll_detail_until_stable()
-                            
-                            # Use extract_detail_items which tries SDUI first
-                            extracted_certs = await extract_detail_items("DetailFallback")
-                            print(f"   Extraction result: {len(extracted_certs)} certs")
-                            
-                            if extracted_certs:
-                                debug_msg.append("Fallback:DetailPage")
-                                section_found = True
-                                break
-                        except Exception as fe:
-                            debug_msg.append(f"FallbackErr:{str(fe)[:30]}")
-                except Exception as fe:
-                    debug_msg.append(f"FallbackBuildErr:{str(fe)[:30]}")
+                if scraped_details:
+                    # The retry already reached the details page on the main tab
+                    if detail_task is not None:
+                        detail_task.cancel()
+                else:
+                    if detail_task is not None:
+                        detail_certs = await detail_task
+                    else:
+                        print(f"🔄 Trying fallback detail URLs under: {base_url}")
+                        detail_certs = await try_detail_fallback("DetailFallback", parallel=True)
+                    print(f"   Extraction result: {len(detail_certs)} certs")
+                    if detail_certs:
+                        extracted_certs = merge_cert_lists(extracted_certs, detail_certs)
+                        debug_msg.append("Fallback:DetailPage")
+                        section_found = True
 
             # Debug: List all sections
             try:
-                all_sec = page.locator("section")
-                count = await all_sec.count()
+                # Section count and heading previews in one round-trip
+                count, previews = await page.evaluate(_SECTION_PREVIEWS_JS, 10)
                 debug_msg.append(f"TotalSections: {count}")
-
-                # Capture preview of section headings for debugging
-                previews = []
-                for i in range(min(count, 10)):
-                    sec = all_sec.nth(i)
-                    try:
-                        heading = await sec.locator("h2, h3, header, span").first.inner_text()
-                    except Exception:
-                        heading = ""
-                    try:
-                        snippet = await sec.inner_text()
-                    except Exception:
-                        snippet = ""
-                    text = (heading or snippet).strip().replace("\n", " ")
-                    if text:
-                        previews.append(text[:80])
                 if previews:
                     debug_msg.append("SectionPreview:" + " || ".join(previews))
             except Exception:
@@ -955,21 +1023,16 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
         debug_msg.append(f"FinalURL:{page.url}")
 
         # If only fallback items with no meaningful fields were gathered, treat as not found
-        def _is_empty_fallback(item: dict) -> bool:
-            return (
-                "fallback" in item.get("source", "").lower()
-                and not item.get("issuer")
-                and not item.get("issue_date")
-                and not item.get("expiry_date")
-                and not item.get("credential_id")
-                and not item.get("verify_link")
-            )
-
+        # (all() stops at the first item that is not an empty fallback)
         if extracted_certs and all(_is_empty_fallback(i) for i in extracted_certs):
             extracted_certs = []
 
-        if extracted_certs:
-            extracted_certs = merge_cert_lists(extracted_certs, [])
+        # A single named item has nothing to deduplicate against; a nameless
+        # one still has to be dropped like dedup would
+        if len(extracted_certs) > 1 or (
+            extracted_certs and not (extracted_certs[0].certificate_name or "").strip()
+        ):
+            extracted_certs = _dedup_by_name(extracted_certs)
 
         if data.debug and len(extracted_certs) == 0:
             debug_files = await scraper_logging.save_debug_files(page, "no_results")
@@ -977,7 +1040,7 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
         print(f"✅ Scraping complete: {len(extracted_certs)} certificates found")
         return build_response(
             data,
-            [CertificateItem(**i) for i in extracted_certs],
+            extracted_certs,
             cookies_loaded,
             is_guest,
             debug_msg,
@@ -985,13 +1048,91 @@ async def scrape_linkedin(data: LinkedInRequest) -> dict:
         )
 
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
+        # Only pay for traceback formatting when debugging
+        print(f"❌ Fatal error: {e!r}")
+        if data.debug:
+            traceback.print_exc()
+        # Certificates gathered before the failure are still worth returning
+        if extracted_certs:
+            debug_msg.append(f"PARTIAL_RESULT:{str(e)[:30]}")
+            return build_response(
+                data,
+                extracted_certs,
+                cookies_loaded,
+                is_guest,
+                debug_msg,
+                debug_files,
+            )
         return build_error(data, str(e), debug_msg)
 
     finally:
         await _cleanup()
 
 
+def _dump_json(obj, pretty: bool = False) -> bytes:
+    """Serialize with orjson when available, else the stdlib json module."""
+    try:
+        import orjson
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    except ImportError:
+        return json.dumps(obj, indent=2 if pretty else None).encode("utf-8")
+
+
+async def scrape_many(requests: list[LinkedInRequest], concurrency: int = MAX_PARALLEL_SCRAPES) -> list[dict]:
+    """Scrape several profiles on one shared browser, a few tabs at a time.
+
+    The browser/context is launched once and reused by every scrape, each of
+    which only opens and closes its own tab. Results keep the input order;
+    a scrape that raises becomes an error entry instead of discarding the
+    rest of the batch.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(req: LinkedInRequest) -> dict:
+        async with sem:
+            return await scrape_linkedin(req)
+
+    results = await asyncio.gather(*[_run(r) for r in requests], return_exceptions=True)
+    return [
+        build_error(req, str(res), ["BATCH_ERROR"]) if isinstance(res, Exception) else res
+        for req, res in zip(requests, results)
+    ]
+
+
+async def _scrape_once(data: LinkedInRequest) -> dict:
+    """Run one scrape and release the pooled browser before the loop ends."""
+    try:
+        return await scrape_linkedin(data)
+    finally:
+        await close_browser()
+
+
+async def _scrape_batch(requests: list[LinkedInRequest], concurrency: int, reuse: bool = True) -> list[dict]:
+    """Run `scrape_many` and release the pooled browser before the loop ends.
+
+    With `reuse=False` every profile gets a cold browser: scrapes run one at
+    a time (the persistent profile directory cannot be opened twice) and the
+    browser is closed after each.
+    """
+    if not reuse:
+        results = []
+        for req in requests:
+            results.append(await _scrape_once(req))
+        return results
+    try:
+        return await scrape_many(requests, concurrency)
+    finally:
+        await close_browser()
+
+
+def _normalize_cli_url(url: str) -> str | None:
+    """Add a missing scheme; None if it is not a LinkedIn URL."""
+    url = url.strip()
+    if not url.startswith("http"):
+        url = f"https://{url}"
+    return url if "linkedin.com" in url else None
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -1003,13 +1144,30 @@ Examples:
   %(prog)s https://www.linkedin.com/in/johndoe/ --debug
   %(prog)s https://www.linkedin.com/in/johndoe/ --use-cdp --cdp-url http://localhost:9222
   %(prog)s https://www.linkedin.com/in/johndoe/ --headless false --max-wait 30000
+  %(prog)s --urls profiles.txt --concurrency 3 -o results.json
         """
     )
     
     parser.add_argument(
         "url",
+        nargs="?",
         help="LinkedIn profile URL to scrape (e.g., https://www.linkedin.com/in/username/)"
     )
+    parser.add_argument(
+        "--urls",
+        help="Text file with one LinkedIn profile URL per line (batch mode)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_PARALLEL_SCRAPES,
+        help=f"Profiles scraped in parallel in batch mode (default: {MAX_PARALLEL_SCRAPES})"
+    )
+    parser.add_argument(
+        "--no-reuse",
+        action="store_true",
+        help="Launch a fresh browser for every profile in batch mode instead of sharing one"
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -1058,46 +1216,63 @@ Examples:
     
     args = parser.parse_args()
     
-    # Validate URL
-    if not args.url.startswith("http"):
-        args.url = f"https://{args.url}"
-    
-    if "linkedin.com" not in args.url:
-        print(f"❌ Error: URL must be a LinkedIn profile URL")
-        sys.exit(1)
+    # Validate URL(s)
+    if args.urls:
+        with open(args.urls, encoding="utf-8") as f:
+            raw_urls = [line for line in f if line.strip() and not line.lstrip().startswith("#")]
+    elif args.url:
+        raw_urls = [args.url]
+    else:
+        parser.error("a profile URL or --urls FILE is required")
+    urls = []
+    for raw in raw_urls:
+        url = _normalize_cli_url(raw)
+        if url is None:
+            print(f"❌ Error: URL must be a LinkedIn profile URL: {raw.strip()}")
+            sys.exit(1)
+        urls.append(url)
     
     # Override cookies path if provided
     if args.cookies:
         import linkedin_scraper_pkg.config as config
         config.COOKIES_FILE = args.cookies
     
-    # Create request object
-    request_data = LinkedInRequest(
-        url=args.url,
-        debug=args.debug,
-        headless=args.headless,
-        max_wait=args.max_wait,
-        use_cdp=args.use_cdp,
-        cdp_url=args.cdp_url,
-        detail_only=args.detail_only,
-        proxy=args.proxy,
-    )
+    # Create request objects
+    requests_data = [
+        LinkedInRequest(
+            url=url,
+            debug=args.debug,
+            headless=args.headless,
+            max_wait=args.max_wait,
+            use_cdp=args.use_cdp,
+            cdp_url=args.cdp_url,
+            detail_only=args.detail_only,
+            proxy=args.proxy,
+        )
+        for url in urls
+    ]
     
     # Run scraper
     try:
-        result = asyncio.run(scrape_linkedin(request_data))
+        if args.urls:
+            result = run_event_loop(_scrape_batch(requests_data, args.concurrency, reuse=not args.no_reuse))
+        else:
+            result = run_event_loop(_scrape_once(requests_data[0]))
         
-        # Output result
+        # Output result (compact unless a human is reading the terminal)
         if args.output:
-            with open(args.output, "w") as f:
-                json.dump(result, f, indent=2)
+            with open(args.output, "wb") as f:
+                f.write(_dump_json(result))
             print(f"\n📁 Results saved to: {args.output}")
         else:
             print("\n📊 Scraping Results:")
-            print(json.dumps(result, indent=2))
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_dump_json(result, pretty=sys.stdout.isatty()) + b"\n")
+            sys.stdout.flush()
         
-        # Exit with appropriate code
-        if result.get("found", False) or result.get("certificates"):
+        # Exit with appropriate code (batch: success if any profile had results)
+        results = result if isinstance(result, list) else [result]
+        if any(r.get("found", False) or r.get("certificates") for r in results):
             sys.exit(0)
         else:
             sys.exit(1)
@@ -1,23 +1,50 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import codecs
+import gzip
+import hashlib
 import json
+import random
+import re
+import time
 import csv
-from typing import List, Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO, List, Optional
+from urllib.parse import urlsplit
 
 import pandas as pd
-from fastapi import FastAPI, File, Form, UploadFile
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+import orjson
+from playwright.async_api import Error as PlaywrightError
+from fastapi import FastAPI, File, Form, Query, Request, UploadFile
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from scraper import scrape_linkedin
 from linkedin_scraper_pkg.models import LinkedInRequest
-from linkedin_scraper_pkg.config import CDP_URL
-from linkedin_scraper_pkg.browser import connect_over_cdp
+from linkedin_scraper_pkg.config import (
+    CDP_URL,
+    MAX_PARALLEL_SCRAPES,
+    MAX_SCRAPES_PER_MINUTE,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_TTL_S,
+)
+from linkedin_scraper_pkg.browser import close_browser, get_cdp_context
+
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Scrapes share one CDP connection; disconnect it when the server stops
+    yield
+    await close_browser()
 
-app = FastAPI(title="LinkedIn Certificate Scraper UI")
+
+app = FastAPI(
+    title="LinkedIn Certificate Scraper UI",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -102,6 +129,12 @@ HTML_PAGE = """
       border-radius: 8px;
       font-size: 14px;
     }
+    .field label.inline {
+      display: flex;
+      align-items: center;
+      gap: 8px;
+      font-weight: 400;
+    }
     .field .hint {
       font-size: 12px;
       color: var(--muted);
@@ -239,6 +272,9 @@ HTML_PAGE = """
           <label>LinkedIn Profile URL</label>
           <input type="url" id="url-input" name="url" placeholder="https://www.linkedin.com/in/username/" />
         </div>
+        <div class="field">
+          <label class="inline"><input type="checkbox" id="refresh-input" /> Re-scrape (ignore cached results)</label>
+        </div>
         <div class="actions">
           <button type="submit" id="btn-scrape" class="btn-primary">Start Scraping</button>
         </div>
@@ -270,6 +306,7 @@ HTML_PAGE = """
     const scrapeForm = document.getElementById('scrape-form');
     const fileInput = document.getElementById('file-input');
     const urlInput = document.getElementById('url-input');
+    const refreshInput = document.getElementById('refresh-input');
     const statusEl = document.getElementById('status');
     const loadingEl = document.getElementById('loading');
     const resultSection = document.getElementById('result-section');
@@ -290,24 +327,58 @@ HTML_PAGE = """
       loadingEl.className = show ? 'show' : '';
     }
 
+    function appendResultRow(row) {
+      const tr = document.createElement('tr');
+      const certs = typeof row.certificate_list === 'string' 
+        ? row.certificate_list 
+        : JSON.stringify(row.certificate_list, null, 2);
+      tr.innerHTML = '<td>' + (row.url_linkedin || row.url || '-') + '</td><td><pre>' + certs + '</pre></td>';
+      resultTableBody.appendChild(tr);
+    }
+
     function showResults(rows) {
       lastResults = rows;
       resultTableBody.innerHTML = '';
       if (!rows || rows.length === 0) {
         resultTableBody.innerHTML = '<tr><td colspan="2">No certificates found.</td></tr>';
       } else {
-        rows.forEach(row => {
-          const tr = document.createElement('tr');
-          const certs = typeof row.certificate_list === 'string' 
-            ? row.certificate_list 
-            : JSON.stringify(row.certificate_list, null, 2);
-          tr.innerHTML = '<td>' + (row.url_linkedin || row.url || '-') + '</td><td><pre>' + certs + '</pre></td>';
-          resultTableBody.appendChild(tr);
-        });
+        rows.forEach(appendResultRow);
       }
       resultSection.className = 'card show';
     }
 
+    // Parsed rows of an NDJSON body, yielded as each line arrives
+    async function* ndjsonRows(body) {
+      const reader = body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      while (true) {
+        const { done, value } = await reader.read();
+        buffer += done ? decoder.decode() : decoder.decode(value, { stream: true });
+        const lines = buffer.split('\\n');
+        buffer = done ? '' : lines.pop();
+        for (const line of lines) {
+          if (line.trim()) yield JSON.parse(line);
+        }
+        if (done) return;
+      }
+    }
+
+    // Render NDJSON rows as each profile finishes
+    async function streamResults(res) {
+      lastResults = [];
+      resultTableBody.innerHTML = '';
+      resultSection.className = 'card show';
+      for await (const row of ndjsonRows(res.body)) {
+        lastResults.push(row);
+        appendResultRow(row);
+        showStatus(lastResults.length + ' profile(s) done...', 'info');
+      }
+      if (lastResults.length === 0) {
+        showResults([]);
+      }
+    }
+
     // Open LinkedIn button
     btnOpenLinkedin.addEventListener('click', async () => {
       btnOpenLinkedin.disabled = true;
@@ -365,8 +436,9 @@ HTML_PAGE = """
           formData.append('url', urlInput.value.trim());
         }
         
-        const res = await fetch('/api/scrape', {
+        const res = await fetch(refreshInput.checked ? '/api/scrape?refresh=1' : '/api/scrape', {
           method: 'POST',
+          headers: { 'Accept': 'application/x-ndjson' },
           body: formData
         });
         
@@ -379,20 +451,9 @@ HTML_PAGE = """
         }
         
         const contentType = res.headers.get('content-type') || '';
-        if (contentType.includes('text/csv')) {
-          // File upload returns CSV directly - convert to display
-          const text = await res.text();
-          const lines = text.trim().split('\\n');
-          const rows = [];
-          for (let i = 1; i < lines.length; i++) {
-            const parts = lines[i].split(',');
-            rows.push({
-              url_linkedin: parts[0] || '',
-              certificate_list: parts.slice(1).join(',') || ''
-            });
-          }
-          showResults(rows);
-          showStatus('Scraping completed! ' + rows.length + ' profile(s) processed.', 'success');
+        if (contentType.includes('application/x-ndjson')) {
+          await streamResults(res);
+          showStatus('Scraping completed! ' + lastResults.length + ' profile(s) processed.', 'success');
         } else {
           const data = await res.json();
           showResults(data.rows || []);
@@ -414,19 +475,19 @@ HTML_PAGE = """
         return;
       }
       
-      let csvContent = 'url_linkedin,certificate_list\\n';
-      lastResults.forEach(row => {
+      // One line per row, handed to the Blob as parts (no growing string)
+      const lines = ['url_linkedin,certificate_list\\n'];
+      for (const row of lastResults) {
         const url = row.url_linkedin || row.url || '';
         let certs = row.certificate_list || '';
         if (typeof certs !== 'string') {
           certs = JSON.stringify(certs);
         }
         // Escape quotes and wrap in quotes
-        certs = '"' + certs.replace(/"/g, '""') + '"';
-        csvContent += url + ',' + certs + '\\n';
-      });
+        lines.push(url + ',"' + certs.replace(/"/g, '""') + '"\\n');
+      }
       
-      const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+      const blob = new Blob(lines, { type: 'text/csv;charset=utf-8;' });
       const url = URL.createObjectURL(blob);
       const a = document.createElement('a');
       a.href = url;
@@ -442,18 +503,62 @@ HTML_PAGE = """
 """
 
 
+# A LinkedIn URL with or without scheme. Anchored on the host, so a cell that
+# merely mentions linkedin.com (or a host like linkedin.computer.net) is
+# skipped instead of being scraped.
+_LINKEDIN_URL_RE = re.compile(r"(?:https?://)?(?:[\w-]+\.)*linkedin\.com(?:[/?#]|$)", re.I)
+
+
 def _extract_urls_from_dataframe(df: pd.DataFrame) -> List[str]:
     if df.empty:
         return []
     candidate_columns = [c for c in df.columns if "url" in c.lower() or "linkedin" in c.lower()]
     col = candidate_columns[0] if candidate_columns else df.columns[0]
-    series = df[col].dropna().astype(str)
+    # Vectorized string ops: one C-level pass per step instead of a Python
+    # loop over every cell
+    series = df[col].dropna().astype("string").str.strip()
+    series = series[series.str.match(_LINKEDIN_URL_RE, na=False)]
+    series = series.where(series.str.startswith("http"), "https://" + series)
+    return series.tolist()
+
+
+def _url_key(url: str) -> str:
+    """Dedup/cache key that treats trivially different spellings of a profile as one.
+
+    Scheme, `www.`/country subdomains, query (`?trk=...`), fragment, trailing
+    slash and case are ignored: `linkedin.com/in/Foo/?trk=x` and
+    `https://id.linkedin.com/in/foo` share a key. The URL that gets scraped
+    and reported back is still the one the user supplied.
+    """
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower()
+    if host.endswith(".linkedin.com"):
+        host = "linkedin.com"
+    return f"{host}{parts.path.rstrip('/').lower()}"
+
+
+def _extract_urls_from_csv(fileobj: BinaryIO) -> List[str]:
+    """Pull LinkedIn URLs out of an uploaded CSV without building a DataFrame.
+
+    Rows are streamed through `csv.reader` straight off the binary file; the
+    URL column is the first header containing "url" or "linkedin", else the
+    first column.
+    """
+    # codecs' reader only needs read(), which SpooledTemporaryFile has on
+    # every supported Python (io.TextIOWrapper also needs readable()/read1(),
+    # added in 3.11), and it leaves the upload's file open
+    reader = csv.reader(codecs.getreader("utf-8-sig")(fileobj))
+    header = next(reader, None)
+    if not header:
+        return []
+    lowered = [h.lower() for h in header]
+    idx = next((i for i, h in enumerate(lowered) if "url" in h or "linkedin" in h), 0)
     urls = []
-    for raw in series:
-        value = raw.strip()
-        if not value or value.lower() == 'nan':
+    for row in reader:
+        if idx >= len(row):
             continue
-        if "linkedin.com" not in value.lower():
+        value = row[idx].strip()
+        if not _LINKEDIN_URL_RE.match(value):
             continue
         if not value.startswith("http"):
             value = f"https://{value}"
@@ -461,7 +566,127 @@ def _extract_urls_from_dataframe(df: pd.DataFrame) -> List[str]:
     return urls
 
 
-async def _scrape_single_url(url: str) -> dict:
+class _TokenBucket:
+    """Async token bucket: `rate` acquisitions per `period` seconds.
+
+    Starts full, so a short burst goes out at once and the rest are spaced
+    evenly. Waiters queue on a lock, so they are served in arrival order.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_per_sec = rate / period
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_per_sec)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_per_sec)
+
+
+# Caps profiles scraped at once across all requests (each is one tab in the
+# shared Chrome) and how fast new ones start, so raising parallelism does
+# not turn into a burst of profile views LinkedIn flags. Created lazily so
+# they bind to the server's event loop.
+_scrape_sem: Optional[asyncio.Semaphore] = None
+_rate_limiter: Optional[_TokenBucket] = None
+
+
+# Failures worth another attempt: the page or CDP link hiccuped, not
+# LinkedIn refusing the profile (authwall/error page) or a bad URL
+_TRANSIENT_ERROR_RE = re.compile(r"timeout|navigation|target .*closed|connection|net::", re.I)
+SCRAPE_ATTEMPTS = 3
+
+
+class _TransientScrapeError(Exception):
+    def __init__(self, row: dict, reason: str):
+        super().__init__(reason)
+        self.row = row
+
+
+# Successful rows by _url_key, oldest first: (stored_at, row). Re-uploads of
+# overlapping lists come back instantly instead of re-opening each profile.
+_result_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _cached_row(url: str) -> Optional[dict]:
+    key = _url_key(url)
+    hit = _result_cache.get(key)
+    if hit is None:
+        return None
+    if time.monotonic() - hit[0] > RESULT_CACHE_TTL_S:
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    return {**hit[1], "url_linkedin": url}
+
+
+def _store_row(url: str, row: dict, found: bool) -> None:
+    # Only rows that actually found certificates: an empty row is what a
+    # logged-out (guest) session or a lazy-load miss returns, and caching it
+    # would replay the miss after the user logs back in
+    if RESULT_CACHE_TTL_S <= 0 or not found:
+        return
+    _result_cache[_url_key(url)] = (time.monotonic(), row)
+    _result_cache.move_to_end(_url_key(url))
+    while len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
+async def _bounded_scrape(url: str, refresh: bool = False) -> dict:
+    """Scrape one URL under the shared caps; failures become an error row.
+
+    Recent results are served from the cache unless `refresh` is set.
+    Transient failures are retried with exponential backoff (1s, 2s, ...
+    plus jitter). The backoff happens outside the semaphore so it does not
+    hold a tab slot. Each attempt takes its rate-limit token only once it
+    holds a slot, so tokens pace actual scrape starts and a caller
+    cancelled while queued spends none.
+    """
+    global _scrape_sem, _rate_limiter
+    if not refresh:
+        row = _cached_row(url)
+        if row is not None:
+            return row
+    if _scrape_sem is None:
+        _scrape_sem = asyncio.Semaphore(max(1, MAX_PARALLEL_SCRAPES))
+    if _rate_limiter is None and MAX_SCRAPES_PER_MINUTE > 0:
+        _rate_limiter = _TokenBucket(MAX_SCRAPES_PER_MINUTE)
+    for attempt in range(SCRAPE_ATTEMPTS):
+        last = attempt == SCRAPE_ATTEMPTS - 1
+        try:
+            async with _scrape_sem:
+                if _rate_limiter is not None:
+                    await _rate_limiter.acquire()
+                row, found = await _scrape_single_url(url)
+            _store_row(url, row, found)
+            return row
+        except _TransientScrapeError as e:
+            if last:
+                return e.row
+            print(f"🔁 Retrying {url} after: {e}")
+        except (asyncio.TimeoutError, PlaywrightError) as e:
+            if last:
+                return {"url_linkedin": url, "certificate_list": f"Error: {str(e)}"}
+            print(f"🔁 Retrying {url} after: {e}")
+        except Exception as e:
+            return {"url_linkedin": url, "certificate_list": f"Error: {str(e)}"}
+        await asyncio.sleep(2 ** attempt + random.random())
+
+
+async def _scrape_single_url(url: str) -> tuple[dict, bool]:
+    """Scrape one profile; returns the row and whether it may be cached.
+
+    Only certificates found on a logged-in session are cacheable.
+    """
     req = LinkedInRequest(
         url=url,
         debug=False,
@@ -473,76 +698,143 @@ async def _scrape_single_url(url: str) -> dict:
     )
     result = await scrape_linkedin(req)
     certs = result.get("certificates_list", [])
-    return {
+    row = {
         "url_linkedin": url,
         "certificate_list": certs if certs != "not found" else []
     }
+    if certs == "error" and _TRANSIENT_ERROR_RE.search(result.get("error", "")):
+        raise _TransientScrapeError(row, result["error"])
+    return row, bool(result.get("found")) and not result.get("guest_mode")
+
+
+async def _scrape_rows(urls: List[str], refresh: bool) -> AsyncIterator[tuple[int, dict]]:
+    """Yield (input index, row) for each URL as its scrape finishes.
+
+    A single URL is scraped directly. Larger batches run on a pool of
+    workers sized to the batch (never wider than MAX_PARALLEL_SCRAPES), so
+    a 500-row upload holds a handful of tasks rather than 500 queued ones,
+    and closing the generator (client gone) cancels what is left.
+    """
+    if len(urls) == 1:
+        yield 0, await _bounded_scrape(urls[0], refresh)
+        return
+    pending = iter(enumerate(urls))
+    done: asyncio.Queue = asyncio.Queue()
+
+    async def _worker():
+        for i, u in pending:
+            await done.put((i, await _bounded_scrape(u, refresh)))
+
+    width = min(len(urls), max(1, MAX_PARALLEL_SCRAPES))
+    workers = [asyncio.create_task(_worker()) for _ in range(width)]
+    try:
+        for _ in urls:
+            yield await done.get()
+    finally:
+        for w in workers:
+            w.cancel()
+
+
+# The page never changes while the server runs: strip indentation and blank
+# lines, encode and gzip it once, and let browsers revalidate with an ETag
+# instead of re-downloading it. Line breaks stay, so the inline JS parses
+# exactly as written.
+_HTML_BYTES = "\n".join(line.strip() for line in HTML_PAGE.splitlines() if line.strip()).encode("utf-8")
+_HTML_GZ = gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0)
+_HTML_ETAG = f'"{hashlib.md5(_HTML_BYTES).hexdigest()}"'
+_HTML_GZ_ETAG = _HTML_ETAG[:-1] + '-gz"'
+_HTML_HEADERS = {"ETag": _HTML_ETAG, "Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+_HTML_GZ_HEADERS = {**_HTML_HEADERS, "ETag": _HTML_GZ_ETAG, "Content-Encoding": "gzip"}
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index() -> HTMLResponse:
-    return HTMLResponse(HTML_PAGE)
+async def index(request: Request) -> Response:
+    gz = "gzip" in request.headers.get("accept-encoding", "")
+    headers = _HTML_GZ_HEADERS if gz else _HTML_HEADERS
+    if request.headers.get("if-none-match") in (_HTML_ETAG, _HTML_GZ_ETAG):
+        return Response(status_code=304, headers={k: v for k, v in headers.items() if k != "Content-Encoding"})
+    return Response(_HTML_GZ if gz else _HTML_BYTES, media_type="text/html", headers=headers)
 
 
 @app.post("/api/open-linkedin")
-async def open_linkedin() -> JSONResponse:
+async def open_linkedin() -> ORJSONResponse:
     try:
-        browser = await asyncio.wait_for(connect_over_cdp(CDP_URL), timeout=10)
-        context = browser.contexts[0] if browser.contexts else await browser.new_context()
+        context = await asyncio.wait_for(get_cdp_context(CDP_URL), timeout=10)
         page = await context.new_page()
         await page.goto("https://www.linkedin.com", wait_until="domcontentloaded", timeout=15000)
-        return JSONResponse({"ok": True})
+        return ORJSONResponse({"ok": True})
     except asyncio.TimeoutError:
-        return JSONResponse(status_code=500, content={"error": "Connection timeout. Make sure Chrome CDP is running."})
+        return ORJSONResponse(status_code=500, content={"error": "Connection timeout. Make sure Chrome CDP is running."})
     except Exception as exc:
-        return JSONResponse(status_code=500, content={"error": str(exc)})
+        return ORJSONResponse(status_code=500, content={"error": str(exc)})
 
 
 @app.post("/api/scrape")
 async def scrape(
+    request: Request,
     file: Optional[UploadFile] = File(default=None),
     url: Optional[str] = Form(default=None),
-) -> JSONResponse:
+    refresh: bool = Query(default=False),
+):
     urls_to_scrape = []
     
     # Handle file upload
     if file and file.filename:
         try:
-            content = await file.read()
+            # Parse straight from the spooled upload instead of copying it
+            # into one bytes object first, in a worker thread so a large
+            # workbook does not stall scrapes already running on the loop
             if file.filename.endswith(".csv"):
-                df = pd.read_csv(io.BytesIO(content))
+                urls_to_scrape = await asyncio.to_thread(_extract_urls_from_csv, file.file)
             else:
-                df = pd.read_excel(io.BytesIO(content))
-            urls_to_scrape = _extract_urls_from_dataframe(df)
+                df = await asyncio.to_thread(pd.read_excel, file.file)
+                urls_to_scrape = _extract_urls_from_dataframe(df)
         except Exception as e:
-            return JSONResponse(status_code=400, content={"error": f"Failed to parse file: {str(e)}"})
+            return ORJSONResponse(status_code=400, content={"error": f"Failed to parse file: {str(e)}"})
     
     # Handle single URL
-    if url and url.strip():
+    if url and _LINKEDIN_URL_RE.match(url.strip()):
         clean_url = url.strip()
         if not clean_url.startswith("http"):
             clean_url = f"https://{clean_url}"
-        if clean_url not in urls_to_scrape:
-            urls_to_scrape.append(clean_url)
+        urls_to_scrape.append(clean_url)
+
+    # Each profile costs seconds of browser time: scrape repeats only once,
+    # keeping the first spelling seen and the input order
+    seen = set()
+    urls_to_scrape = [u for u in urls_to_scrape if not (_url_key(u) in seen or seen.add(_url_key(u)))]
     
     if not urls_to_scrape:
-        return JSONResponse(status_code=400, content={"error": "No valid LinkedIn URLs found."})
+        return ORJSONResponse(status_code=400, content={"error": "No valid LinkedIn URLs found."})
     
-    # Scrape all URLs
-    results = []
-    for u in urls_to_scrape:
-        try:
-            result = await _scrape_single_url(u)
-            results.append(result)
-        except Exception as e:
-            results.append({
-                "url_linkedin": u,
-                "certificate_list": f"Error: {str(e)}"
-            })
+    # Clients that accept NDJSON (the web UI) get one row per line as each
+    # profile finishes; everyone else gets the {"rows": [...]} document
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        async def _rows():
+            async for _, row in _scrape_rows(urls_to_scrape, refresh):
+                yield orjson.dumps(row) + b"\n"
+
+        return StreamingResponse(_rows(), media_type="application/x-ndjson")
+
+    # Scrape all URLs, a few at a time; rows keep the input order
+    results: List[Optional[dict]] = [None] * len(urls_to_scrape)
+    async for i, row in _scrape_rows(urls_to_scrape, refresh):
+        results[i] = row
     
-    return JSONResponse({"rows": results})
+    # Returning the response directly skips FastAPI's jsonable_encoder walk
+    # over every row; orjson serializes the plain dicts as-is
+    return ORJSONResponse({"rows": list(results)})
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8787)
+
+    # Same server setup as run_ui.py; uvloop is POSIX-only
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=8787,
+        loop="asyncio" if sys.platform.startswith("win") else "uvloop",
+        http="httptools",
+    )